@@ -1,12 +1,15 @@
 """Main Textual application for Civ7 Debug Terminal."""
 
+import bisect
+import re
+from collections import deque
+from pathlib import Path
 from typing import Optional
 
-import pyperclip
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Container, Vertical
-from textual.events import Click, Key
+from textual.events import Click
 from textual.message import Message
 from textual.screen import ModalScreen
 from textual.widgets import Button, Input, Static, Tab, TabbedContent, TabPane, TextArea
@@ -102,6 +105,23 @@ class RenameTabScreen(ModalScreen):
         self.dismiss(None)
 
 
+# Tokenizer for the syntax-completeness check. Complete string literals
+# (with escapes) are consumed wholesale by the C regex engine; a quote that
+# cannot form a complete literal falls through to the open_str alternative.
+_SYNTAX_TOKEN_RE = re.compile(
+    r'"(?:\\.|[^"\\])*"'
+    r"|'(?:\\.|[^'\\])*'"
+    r"|`(?:\\.|[^`\\])*`"
+    r"|(?P<open_str>[\"'`])"
+    r"|(?P<bracket>[(){}\[\]])",
+    re.S,
+)
+
+# Characters that can make syntax incomplete; commands without any of them
+# (most one-liners) skip the tokenizer entirely
+_BRACKET_QUOTE_SET = frozenset("(){}[]\"'`")
+
+
 class CommandInput(TextArea):
     """Multiline input widget with history support."""
 
@@ -133,62 +153,54 @@ class CommandInput(TextArea):
         Binding("ctrl+a", "select_all", "Select All", show=False, priority=True),
     ]
 
+    # Declared at class level so methods defined above __init__ type-check;
+    # the instance value is set in __init__
+    _syntax_cache: tuple[str, int, int, int]
+
     def action_select_all(self) -> None:
         """Select all text in the input."""
         self.select_all()
 
     def _is_syntax_complete(self, text: str) -> bool:
         """Check if JavaScript syntax is complete (balanced brackets/quotes)."""
-        # Track bracket counts and string state
-        paren_count = 0  # ()
-        brace_count = 0  # {}
-        bracket_count = 0  # []
-        in_string = None  # None, '"', "'", or '`'
-        escape_next = False
-
-        for char in text:
-            # Handle escape sequences in strings
-            if escape_next:
-                escape_next = False
-                continue
-
-            if char == '\\' and in_string:
-                escape_next = True
-                continue
-
-            # Handle string delimiters
-            if char in ('"', "'", '`'):
-                if in_string is None:
-                    in_string = char
-                elif in_string == char:
-                    in_string = None
-                continue
-
-            # Skip bracket counting if inside a string
-            if in_string:
-                continue
-
-            # Count brackets
-            if char == '(':
-                paren_count += 1
-            elif char == ')':
-                paren_count -= 1
-            elif char == '{':
-                brace_count += 1
-            elif char == '}':
-                brace_count -= 1
-            elif char == '[':
-                bracket_count += 1
-            elif char == ']':
-                bracket_count -= 1
-
-        # Syntax is complete if all brackets balanced and not in a string
-        return (
-            paren_count == 0
-            and brace_count == 0
-            and bracket_count == 0
-            and in_string is None
-        )
+        # Fast path: nothing bracket- or quote-like anywhere (C-level scan)
+        if _BRACKET_QUOTE_SET.isdisjoint(text):
+            return True
+
+        # Resume from the previous scan when the buffer only grew (the
+        # common Enter-on-a-growing-block case). The cache is only written
+        # after scans that end outside any string literal, so resuming at
+        # the cached length can never split a token.
+        prev_text, paren_count, brace_count, bracket_count = self._syntax_cache
+        if prev_text and text.startswith(prev_text):
+            pos = len(prev_text)
+        else:
+            pos = 0
+            paren_count = brace_count = bracket_count = 0
+
+        # Let the C regex engine consume string literals wholesale; only
+        # bracket matches and unterminated quotes reach Python code.
+        for match in _SYNTAX_TOKEN_RE.finditer(text, pos):
+            if match.lastgroup == "bracket":
+                char = match.group()
+                if char == '(':
+                    paren_count += 1
+                elif char == ')':
+                    paren_count -= 1
+                elif char == '{':
+                    brace_count += 1
+                elif char == '}':
+                    brace_count -= 1
+                elif char == '[':
+                    bracket_count += 1
+                else:
+                    bracket_count -= 1
+            elif match.lastgroup == "open_str":
+                # Unterminated string literal; don't cache mid-string state
+                return False
+
+        self._syntax_cache = (text, paren_count, brace_count, bracket_count)
+        return paren_count == 0 and brace_count == 0 and bracket_count == 0
 
     def action_submit(self) -> None:
         """Submit the current input, or continue if syntax incomplete."""
@@ -220,17 +232,27 @@ class CommandInput(TextArea):
             self.value = value
             super().__init__()
 
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
-        self._history: list[str] = []
+        # Ring buffer: caps resident history memory for long-lived sessions
+        self._history: deque[str] = deque(maxlen=1000)
+        self._history_set: set[str] = set()  # O(1) dedup lookup
         self._history_index: int = -1
         self._current_input: str = ""
         # Tab-completion state
+        self._applying_completion: bool = False
         self._completions: list[str] = []
         self._completion_index: int = -1
         self._completion_prefix: str = ""
         self._completion_start: int = -1
+        self._completion_prev_len: int = 0
         self._completion_engine: Optional[CompletionEngine] = None
+        # Cached line-start offsets, keyed by the text they were built from
+        self._line_starts_text: str = ""
+        self._line_starts_cache: list[int] = [0]
+        # Last syntax scan: (text, paren, brace, bracket) -- lets repeated
+        # Enter presses on a growing block resume instead of rescanning
+        self._syntax_cache = ("", 0, 0, 0)
 
     def set_completion_engine(self, engine: CompletionEngine) -> None:
         """Attach a CompletionEngine for tab completion."""
@@ -248,34 +270,32 @@ class CommandInput(TextArea):
 
     def _reset_completion_state(self) -> None:
         """Clear any in-progress tab completion cycle."""
+        # Common case: no cycle active, nothing to clear
+        if self._completion_index < 0 and not self._completions:
+            return
         self._completions = []
         self._completion_index = -1
         self._completion_prefix = ""
         self._completion_start = -1
+        self._completion_prev_len = 0
+
+    def _line_starts(self) -> list[int]:
+        """Return the flat offset of each line start, cached per text value."""
+        text = self.text
+        if text != self._line_starts_text:
+            starts = [0]
+            idx = text.find("\n")
+            while idx != -1:
+                starts.append(idx + 1)
+                idx = text.find("\n", idx + 1)
+            self._line_starts_text = text
+            self._line_starts_cache = starts
+        return self._line_starts_cache
 
     def _calc_flat_offset(self) -> int:
         """Return the cursor position as a flat character offset into self.text."""
         row, col = self.cursor_location
-        offset = 0
-        for i, line in enumerate(self.text.split("\n")):
-            if i == row:
-                offset += col
-                break
-            offset += len(line) + 1  # +1 for the newline
-        return offset
-
-    def _get_current_partial(self) -> str:
-        """Extract the text after the last dot before cursor (the partial member name).
-
-        If the token has no dot, returns the whole token.
-        """
-        offset = self._calc_flat_offset()
-        if self._completion_engine is None:
-            return ""
-        token = self._completion_engine._extract_token(self.text, offset)
-        if "." in token:
-            return token.rsplit(".", 1)[1]
-        return token
+        return self._line_starts()[row] + col
 
     def action_complete(self) -> None:
         """Handle Tab: start or cycle through completions."""
@@ -288,14 +308,18 @@ class CommandInput(TextArea):
             self._apply_completion()
             return
 
-        # Start a new completion
+        # Start a new completion -- one buffer scan, the engine hands back
+        # the token it extracted alongside the candidates
         offset = self._calc_flat_offset()
-        candidates = self._completion_engine.get_completions(self.text, offset)
+        candidates, token_info = self._completion_engine.get_completions(self.text, offset)
         if not candidates:
             return
 
-        self._completion_prefix = self._get_current_partial()
-        self._completion_start = offset - len(self._completion_prefix)
+        token = token_info.token
+        partial = token.rsplit(".", 1)[1] if "." in token else token
+        self._completion_prefix = partial
+        self._completion_start = offset - len(partial)
+        self._completion_prev_len = len(partial)
         self._completions = candidates
         self._completion_index = 0
         self._apply_completion()
@@ -305,38 +329,62 @@ class CommandInput(TextArea):
 
         Uses ``_completion_start`` so that cycling works correctly -- each
         successive Tab replaces from the same start position regardless of
-        the length of the previously inserted candidate.
+        the length of the previously inserted candidate. The edit goes
+        through ``replace`` so only the token is touched instead of
+        reloading the whole document.
         """
         if not self._completions or self._completion_index < 0:
             return
 
         chosen = self._completions[self._completion_index]
         start = self._completion_start
-        offset = self._calc_flat_offset()
 
-        full_text = self.text
-        new_text = full_text[:start] + chosen + full_text[offset:]
-        new_cursor_offset = start + len(chosen)
+        # Convert the flat start offset to (row, col). The edit ends
+        # after the previously inserted candidate (or the original
+        # partial), derived from tracked state rather than the live
+        # cursor: cursor movement doesn't edit, so the cycle state
+        # survives it, and trusting the moved cursor would replace the
+        # wrong span. If the cursor wandered off, drop the cycle.
+        starts = self._line_starts()
+        start_row = bisect.bisect_right(starts, start) - 1
+        start_col = start - starts[start_row]
+        end = (start_row, start_col + self._completion_prev_len)
+        if self.cursor_location != end:
+            self._reset_completion_state()
+            return
+
+        self._applying_completion = True
+        try:
+            self.replace(chosen, (start_row, start_col), end)
+        finally:
+            self._applying_completion = False
+        self._completion_prev_len = len(chosen)
 
-        self.load_text(new_text)
+        # Candidates never contain newlines, so the cursor stays on this row
+        self.move_cursor((start_row, start_col + len(chosen)))
 
-        # Reposition cursor
-        pos = 0
-        for row_idx, line in enumerate(new_text.split("\n")):
-            if pos + len(line) >= new_cursor_offset:
-                col_idx = new_cursor_offset - pos
-                self.move_cursor((row_idx, col_idx))
-                break
-            pos += len(line) + 1  # +1 for newline
+    def edit(self, edit):
+        """Reset any completion cycle when the document is actually edited.
 
-    def on_key(self, event: Key) -> None:
-        """Reset completion state on any non-Tab key."""
-        if event.key != "tab":
+        This replaces the old per-keystroke ``on_key`` reset: benign keys
+        (cursor movement, modifiers) no longer do any work, and edits made
+        by ``_apply_completion`` itself are exempt so cycling survives.
+        """
+        if not self._applying_completion:
             self._reset_completion_state()
+        return super().edit(edit)
 
     def add_to_history(self, command: str) -> None:
-        """Add a command to history."""
-        if command.strip() and (not self._history or self._history[-1] != command):
+        """Add a command to history (MRU: repeats move to the end)."""
+        if command.strip():
+            if command in self._history_set:
+                # Re-append so Up-arrow finds the most recent use first
+                self._history.remove(command)
+            else:
+                if len(self._history) == self._history.maxlen:
+                    # Appending will evict the oldest entry
+                    self._history_set.discard(self._history[0])
+                self._history_set.add(command)
             self._history.append(command)
         self._history_index = -1
         self._current_input = ""
@@ -394,6 +442,39 @@ class CommandInput(TextArea):
         self._reset_completion_state()
 
 
+# Prefix TabbedContent puts on the ids of its internal Tab widgets
+_CONTENT_TAB_PREFIX = "--content-tab-"
+
+# /help output, built once at import time and written in a single append
+_HELP_LINES = (
+    "Available commands:",
+    "  /copy    - Copy last response to clipboard",
+    "  /copyall - Copy all terminal output to clipboard",
+    "  /clear   - Clear the screen",
+    "  /quit    - Exit the terminal",
+    "  /help    - Show this help",
+    "",
+    "Keyboard shortcuts:",
+    "  Enter         - Execute (auto-continues if syntax incomplete)",
+    "  Ctrl+Enter    - Force new line (max 5 lines)",
+    "  Ctrl+J        - Force new line (alternative)",
+    "  Up/Down       - Navigate history / move cursor",
+    "  Ctrl+C        - Copy selection / Cancel / Copy last response",
+    "  Ctrl+Shift+C  - Copy last response",
+    "  Ctrl+D        - Exit terminal",
+    "  Ctrl+L        - Clear screen",
+    "  PageUp/Down   - Scroll output",
+    "",
+    "Tab shortcuts:",
+    "  Ctrl+T        - New tab",
+    "  Ctrl+W        - Close tab",
+    "  Ctrl+Tab      - Next tab",
+    "  Ctrl+Shift+Tab- Previous tab",
+    "",
+    "Comments: Lines starting with // or # are echoed but not sent",
+)
+
+
 class Civ7TerminalApp(App):
     """Main Civ7 Debug Terminal application."""
 
@@ -452,6 +533,12 @@ class Civ7TerminalApp(App):
         self._session_dir = session_dir
 
         self._connection: Optional[ConnectionManager] = None
+        # Cached widget references (set once in compose/on_mount) so hot
+        # handlers don't re-run CSS queries over the widget tree
+        self._command_input: Optional[CommandInput] = None
+        self._status_bar: Optional[StatusBar] = None
+        self._tabs: Optional[TabbedContent] = None
+        self._sessions: dict[str, TerminalSession] = {}
         self._tab_counter: int = 0
         self._pending_tab_id: Optional[str] = None  # Tab awaiting response
         self._ever_connected: bool = False  # Track if we've connected at least once
@@ -466,19 +553,25 @@ class Civ7TerminalApp(App):
                 self._tab_counter += 1
                 tab_id = f"session-{self._tab_counter}"
                 with TabPane(f"Session {self._tab_counter}", id=tab_id):
-                    yield TerminalSession(
+                    session = TerminalSession(
                         session_id=tab_id,
                         session_dir=self._session_dir,
                         tab_suffix=f"_tab{self._tab_counter}",
                         id=f"terminal-{tab_id}",
                     )
+                    self._sessions[tab_id] = session
+                    yield session
         yield CommandInput(id="command-input")
 
     async def on_mount(self) -> None:
         """Initialize on mount."""
+        # Cache widget references for the hot paths
+        self._command_input = self.query_one(CommandInput)
+        self._status_bar = self.query_one(StatusBar)
+        self._tabs = self.query_one(TabbedContent)
+
         # Set up status bar
-        status_bar = self.query_one(StatusBar)
-        status_bar.set_host_info(self._host, self._port)
+        self._status_bar.set_host_info(self._host, self._port)
 
         # Set up connection manager
         config = ConnectionConfig(host=self._host, port=self._port)
@@ -492,39 +585,78 @@ class Civ7TerminalApp(App):
         # Start connection
         await self._connection.start()
 
-        # Load completions engine
-        from pathlib import Path as _Path
-
-        completions_path = _Path(__file__).resolve().parent.parent / "completions.json"
-        engine = CompletionEngine()
-        if engine.load(completions_path):
-            self.query_one(CommandInput).set_completion_engine(engine)
+        # Load completions engine off-thread; the input works without it
+        # until it is attached, so first paint never waits on disk I/O.
+        self.run_worker(self._load_completions, thread=True, exclusive=True)
 
         # Focus on input
-        self.query_one(CommandInput).focus()
+        self._command_input.focus()
 
         # Show help hint in first tab
         session = self._get_active_session()
         if session:
             session.add_info("Type /help for available commands")
 
+    def _load_completions(self) -> None:
+        """Load the completion engine (runs in a worker thread)."""
+        completions_path = Path(__file__).resolve().parent.parent / "completions.json"
+        if not completions_path.is_file():
+            # Running from a zipapp: __file__ points inside the archive,
+            # so the repo-root path doesn't exist. Fall back to the copy
+            # bundled in the package.
+            bundled = self._extract_bundled_completions()
+            if bundled is not None:
+                completions_path = bundled
+        engine = CompletionEngine()
+        if engine.load(completions_path):
+
+            def attach() -> None:
+                if self._command_input is not None:
+                    self._command_input.set_completion_engine(engine)
+
+            self.call_from_thread(attach)
+
+    @staticmethod
+    def _extract_bundled_completions() -> Optional[Path]:
+        """Materialize the packaged completions.json in the user cache dir.
+
+        Inside a zipapp the resource can't be stat'ed in place, and
+        CompletionEngine keeps its pickled shadow cache next to the JSON,
+        so extract once to ~/.cache/civ7_terminal and rewrite only when
+        the bundled bytes change.
+        """
+        import os
+        from importlib.resources import files
+
+        try:
+            resource = files("civ7_terminal").joinpath("completions.json")
+            if not resource.is_file():
+                return None
+            data = resource.read_bytes()
+        except OSError:
+            return None
+
+        target = Path(os.path.expanduser("~/.cache/civ7_terminal/completions.json"))
+        try:
+            if not target.is_file() or target.read_bytes() != data:
+                target.parent.mkdir(parents=True, exist_ok=True)
+                target.write_bytes(data)
+        except OSError:
+            return None
+        return target
+
     def _get_active_session(self) -> Optional[TerminalSession]:
         """Get the currently active terminal session."""
-        try:
-            tabs = self.query_one(TabbedContent)
-            active_tab_id = tabs.active
-            if active_tab_id:
-                return self.query_one(f"#terminal-{active_tab_id}", TerminalSession)
-        except Exception:
-            pass
+        if self._tabs is None:
+            return None
+        active_tab_id = self._tabs.active
+        if active_tab_id:
+            return self._sessions.get(active_tab_id)
         return None
 
     def _get_session_by_id(self, tab_id: str) -> Optional[TerminalSession]:
         """Get a terminal session by its tab ID."""
-        try:
-            return self.query_one(f"#terminal-{tab_id}", TerminalSession)
-        except Exception:
-            return None
+        return self._sessions.get(tab_id)
 
     def on_click(self, event: Click) -> None:
         """Handle mouse clicks for tab rename."""
@@ -540,11 +672,10 @@ class Civ7TerminalApp(App):
 
     def _show_rename_tab_screen(self, tab: Tab) -> None:
         """Show the rename tab screen."""
-        # Get the tab pane ID from the tab
+        # Get the tab pane ID from the tab (one scan: strip by slicing)
         tab_id = tab.id
-        if tab_id and tab_id.startswith("--content-tab-"):
-            # Extract the actual pane ID
-            pane_id = tab_id.replace("--content-tab-", "")
+        if tab_id and tab_id.startswith(_CONTENT_TAB_PREFIX):
+            pane_id = tab_id[len(_CONTENT_TAB_PREFIX):]
         else:
             pane_id = tab_id
 
@@ -560,11 +691,14 @@ class Civ7TerminalApp(App):
     def _rename_tab(self, tab_id: str, new_name: str) -> None:
         """Rename a tab."""
         try:
-            tabs = self.query_one(TabbedContent)
-            # Find the tab and update its label
+            tabs = self._tabs
+            if tabs is None:
+                return
+            # Find the tab and update its label, comparing against the
+            # expected full id instead of substring-searching every tab
+            target = _CONTENT_TAB_PREFIX + tab_id
             for tab in tabs.query(Tab):
-                # Match by the pane ID in the tab's ID
-                if tab.id and tab_id in tab.id:
+                if tab.id == target or tab.id == tab_id:
                     tab.label = new_name
                     break
         except Exception:
@@ -581,11 +715,8 @@ class Civ7TerminalApp(App):
         retry_countdown: Optional[float],
     ) -> None:
         """Handle connection state changes."""
-        try:
-            status_bar = self.query_one(StatusBar)
-            status_bar.set_connection_state(state, retry_countdown)
-        except Exception:
-            pass  # Widget not available yet
+        if self._status_bar is not None:
+            self._status_bar.set_connection_state(state, retry_countdown)
 
         # Show connection status in active session (avoid spamming)
         session = self._get_active_session()
@@ -637,7 +768,9 @@ class Civ7TerminalApp(App):
 
     async def on_command_input_submitted(self, event: CommandInput.Submitted) -> None:
         """Handle command input submission."""
-        command_input = self.query_one(CommandInput)
+        command_input = self._command_input
+        if command_input is None:
+            return
         command = event.value.strip()
 
         if not command:
@@ -649,26 +782,33 @@ class Civ7TerminalApp(App):
 
         # Handle built-in commands (first line only for multiline)
         # But not comments starting with // or #
-        first_line = command.split("\n")[0].strip()
+        lines = command.split("\n")
+        first_line = lines[0].strip()
         if first_line.startswith("/") and not first_line.startswith("//"):
             await self._handle_builtin_command(first_line)
             return
 
-        # Send command
-        await self._send_command(command)
+        # Send command (pass the lines we already split)
+        await self._send_command(command, lines)
+
+    async def _send_command(self, command: str, lines: Optional[list[str]] = None) -> None:
+        """Send a command to the debug port, filtering out comments.
 
-    async def _send_command(self, command: str) -> None:
-        """Send a command to the debug port, filtering out comments."""
+        Args:
+            command: The full command string.
+            lines: The command pre-split on newlines, if the caller already
+                did so; avoids splitting large pasted blocks twice.
+        """
         session = self._get_active_session()
         if not session:
             return
 
         # Track which tab sent this command for response routing
-        tabs = self.query_one(TabbedContent)
-        self._pending_tab_id = tabs.active
+        self._pending_tab_id = self._tabs.active if self._tabs else None
 
         # Split into lines and process
-        lines = command.split("\n")
+        if lines is None:
+            lines = command.split("\n")
         code_lines = []
 
         for line in lines:
@@ -694,53 +834,47 @@ class Civ7TerminalApp(App):
         if self._connection:
             await self._connection.send_command(command)
 
+    def _cmd_help(self, session: TerminalSession) -> None:
+        """Handle /help."""
+        session.add_info_block(_HELP_LINES)
+
+    def _cmd_copy(self, session: TerminalSession) -> None:
+        """Handle /copy."""
+        self.action_copy_last_response()
+
+    def _cmd_copyall(self, session: TerminalSession) -> None:
+        """Handle /copyall."""
+        self._copy_all_output()
+
+    def _cmd_clear(self, session: TerminalSession) -> None:
+        """Handle /clear."""
+        session.clear()
+
+    def _cmd_quit(self, session: TerminalSession) -> None:
+        """Handle /quit."""
+        self.exit()
+
+    _BUILTIN_DISPATCH = {
+        "/help": _cmd_help,
+        "/copy": _cmd_copy,
+        "/copyall": _cmd_copyall,
+        "/clear": _cmd_clear,
+        "/quit": _cmd_quit,
+    }
+
     async def _handle_builtin_command(self, command: str) -> None:
-        """Handle built-in slash commands."""
+        """Handle built-in slash commands via dict dispatch."""
         session = self._get_active_session()
         if not session:
             return
 
-        cmd = command.lower().split()[0]
-
-        if cmd == "/help":
-            session.add_info("Available commands:")
-            session.add_info("  /copy    - Copy last response to clipboard")
-            session.add_info("  /copyall - Copy all terminal output to clipboard")
-            session.add_info("  /clear   - Clear the screen")
-            session.add_info("  /quit    - Exit the terminal")
-            session.add_info("  /help    - Show this help")
-            session.add_info("")
-            session.add_info("Keyboard shortcuts:")
-            session.add_info("  Enter         - Execute (auto-continues if syntax incomplete)")
-            session.add_info("  Ctrl+Enter    - Force new line (max 5 lines)")
-            session.add_info("  Ctrl+J        - Force new line (alternative)")
-            session.add_info("  Up/Down       - Navigate history / move cursor")
-            session.add_info("  Ctrl+C        - Copy selection / Cancel / Copy last response")
-            session.add_info("  Ctrl+Shift+C  - Copy last response")
-            session.add_info("  Ctrl+D        - Exit terminal")
-            session.add_info("  Ctrl+L        - Clear screen")
-            session.add_info("  PageUp/Down   - Scroll output")
-            session.add_info("")
-            session.add_info("Tab shortcuts:")
-            session.add_info("  Ctrl+T        - New tab")
-            session.add_info("  Ctrl+W        - Close tab")
-            session.add_info("  Ctrl+Tab      - Next tab")
-            session.add_info("  Ctrl+Shift+Tab- Previous tab")
-            session.add_info("")
-            session.add_info("Comments: Lines starting with // or # are echoed but not sent")
-
-        elif cmd == "/copy":
-            self.action_copy_last_response()
-
-        elif cmd == "/copyall":
-            self._copy_all_output()
-
-        elif cmd == "/clear":
-            session.clear()
-
-        elif cmd == "/quit":
-            self.exit()
+        # Lowercase only the first token, without splitting the whole string
+        sep = command.find(" ")
+        cmd = (command[:sep] if sep >= 0 else command).lower()
 
+        handler = self._BUILTIN_DISPATCH.get(cmd)
+        if handler is not None:
+            handler(self, session)
         else:
             session.add_error(f"Unknown command: {cmd}")
 
@@ -768,11 +902,46 @@ class Civ7TerminalApp(App):
             scroll = session.terminal.query_one("#output-scroll")
             scroll.scroll_down(animate=False)
 
+    def _copy_to_clipboard(self, text: str, success_msg: str) -> None:
+        """Copy text to the clipboard in a worker thread.
+
+        pyperclip can fork a subprocess (xclip/xsel on Linux) and block for
+        tens of milliseconds or worse, so both the copy and its status
+        message are kept off the event loop.
+        """
+
+        def copy() -> None:
+            # Deferred import: pyperclip's platform probing runs on first
+            # clipboard use, in this worker, instead of at app startup
+            import pyperclip
+
+            try:
+                pyperclip.copy(text)
+            except Exception as e:
+                self.call_from_thread(self._clipboard_done, f"Failed to copy: {e}", True)
+            else:
+                self.call_from_thread(self._clipboard_done, success_msg, False)
+
+        self.run_worker(copy, thread=True, exclusive=False)
+
+    def _clipboard_done(self, message: str, is_error: bool) -> None:
+        """Report a clipboard result in the active session (UI thread)."""
+        session = self._get_active_session()
+        if not session:
+            return
+        if is_error:
+            session.add_error(message)
+        else:
+            session.add_info(message)
+
     def action_cancel_input(self) -> None:
         """Cancel current input or copy selected text (Ctrl+C behavior)."""
-        command_input = self.query_one(CommandInput)
+        command_input = self._command_input
         session = self._get_active_session()
 
+        if command_input is None:
+            return
+
         if not session:
             return
 
@@ -780,8 +949,7 @@ class Civ7TerminalApp(App):
         try:
             selected = command_input.selected_text
             if selected:
-                pyperclip.copy(selected)
-                session.add_info("Copied to clipboard")
+                self._copy_to_clipboard(selected, "Copied to clipboard")
                 return
         except Exception:
             pass
@@ -794,11 +962,9 @@ class Civ7TerminalApp(App):
         else:
             # No input and no selection - copy last response
             if session.last_response:
-                try:
-                    pyperclip.copy(session.last_response)
-                    session.add_info("Copied last response to clipboard")
-                except Exception as e:
-                    session.add_error(f"Failed to copy: {e}")
+                self._copy_to_clipboard(
+                    session.last_response, "Copied last response to clipboard"
+                )
             else:
                 session.add_info("^C")
 
@@ -809,11 +975,9 @@ class Civ7TerminalApp(App):
             return
 
         if session.last_response:
-            try:
-                pyperclip.copy(session.last_response)
-                session.add_info("Copied last response to clipboard")
-            except Exception as e:
-                session.add_error(f"Failed to copy: {e}")
+            self._copy_to_clipboard(
+                session.last_response, "Copied last response to clipboard"
+            )
         else:
             session.add_info("No response to copy")
 
@@ -824,19 +988,21 @@ class Civ7TerminalApp(App):
             return
 
         try:
-            output_area = session.terminal.query_one(TextArea)
-            all_text = output_area.text
-            if all_text:
-                pyperclip.copy(all_text)
-                session.add_info("Copied all output to clipboard")
-            else:
-                session.add_info("No output to copy")
+            all_text = session.terminal.query_one(TextArea).text
         except Exception as e:
             session.add_error(f"Failed to copy: {e}")
+            return
+
+        if all_text:
+            self._copy_to_clipboard(all_text, "Copied all output to clipboard")
+        else:
+            session.add_info("No output to copy")
 
     async def action_new_tab(self) -> None:
         """Create a new tab."""
-        tabs = self.query_one(TabbedContent)
+        tabs = self._tabs
+        if tabs is None:
+            return
 
         self._tab_counter += 1
         tab_id = f"session-{self._tab_counter}"
@@ -852,6 +1018,7 @@ class Civ7TerminalApp(App):
         )
 
         # Mount the pane and session
+        self._sessions[tab_id] = new_session
         await tabs.add_pane(new_pane)
         await new_pane.mount(new_session)
 
@@ -859,7 +1026,8 @@ class Civ7TerminalApp(App):
         tabs.active = tab_id
 
         # Focus input
-        self.query_one(CommandInput).focus()
+        if self._command_input is not None:
+            self._command_input.focus()
 
         # Show welcome in new tab
         session = self._get_active_session()
@@ -869,7 +1037,9 @@ class Civ7TerminalApp(App):
 
     def action_close_tab(self) -> None:
         """Close the current tab."""
-        tabs = self.query_one(TabbedContent)
+        tabs = self._tabs
+        if tabs is None:
+            return
 
         # Don't close if only one tab
         if tabs.tab_count <= 1:
@@ -881,16 +1051,21 @@ class Civ7TerminalApp(App):
         # Get current tab ID and remove it
         current_tab_id = tabs.active
         if current_tab_id:
+            self._sessions.pop(current_tab_id, None)
             tabs.remove_pane(current_tab_id)
 
         # Focus input
-        self.query_one(CommandInput).focus()
+        if self._command_input is not None:
+            self._command_input.focus()
 
     def action_next_tab(self) -> None:
         """Switch to the next tab."""
-        tabs = self.query_one(TabbedContent)
-        # Get list of tab IDs
-        tab_ids = [tab.id for tab in tabs.query("TabPane")]
+        tabs = self._tabs
+        if tabs is None:
+            return
+        # _sessions is insertion-ordered and mirrors pane add/remove, so its
+        # keys are the tab order -- no DOM query needed per keypress.
+        tab_ids = list(self._sessions)
         if not tab_ids or tabs.active not in tab_ids:
             return
 
@@ -899,13 +1074,15 @@ class Civ7TerminalApp(App):
         tabs.active = tab_ids[next_idx]
 
         # Focus input
-        self.query_one(CommandInput).focus()
+        if self._command_input is not None:
+            self._command_input.focus()
 
     def action_prev_tab(self) -> None:
         """Switch to the previous tab."""
-        tabs = self.query_one(TabbedContent)
-        # Get list of tab IDs
-        tab_ids = [tab.id for tab in tabs.query("TabPane")]
+        tabs = self._tabs
+        if tabs is None:
+            return
+        tab_ids = list(self._sessions)
         if not tab_ids or tabs.active not in tab_ids:
             return
 
@@ -914,4 +1091,5 @@ class Civ7TerminalApp(App):
         tabs.active = tab_ids[prev_idx]
 
         # Focus input
-        self.query_one(CommandInput).focus()
+        if self._command_input is not None:
+            self._command_input.focus()
@@ -0,0 +1,170 @@
+"""Command-line entry point logic for the Civ7 Debug Terminal.
+
+Lives outside __main__.py so the optional mypyc build can compile it:
+runpy needs a source module with a code object, which a C extension
+doesn't provide, so __main__.py stays a pure-Python shim importing from
+here.
+"""
+
+import os
+import sys
+
+# types is already loaded by the interpreter at startup, so this import
+# is a sys.modules hit, not extra work
+from types import SimpleNamespace
+from typing import NoReturn
+
+__version__ = "0.1.0"
+
+# Hand-written help text mirroring the argparse output, so the common
+# --help/--version invocations never pay the argparse import cost.
+_HELP_TEXT = """\
+usage: civ7-terminal [-h] [--host HOST] [--port PORT]
+                     [--session-dir SESSION_DIR] [--version]
+
+Debug terminal for Civilization 7
+
+options:
+  -h, --help            show this help message and exit
+  --host HOST, -H HOST  Debug server host address (default: 127.0.0.1)
+  --port PORT, -p PORT  Debug server port (default: 4318)
+  --session-dir SESSION_DIR, -s SESSION_DIR
+                        Directory for session log files (default: ./sessions)
+  --version, -v         show program's version number and exit"""
+
+
+def _arg_error(message: str) -> NoReturn:
+    """Print a usage error the way argparse would and exit 2."""
+    print("usage: civ7-terminal [-h] [--host HOST] [--port PORT]", file=sys.stderr)
+    print("                     [--session-dir SESSION_DIR] [--version]", file=sys.stderr)
+    print("civ7-terminal: error: " + message, file=sys.stderr)
+    sys.exit(2)
+
+
+def parse_args() -> SimpleNamespace:
+    """Parse command-line arguments.
+
+    Hand-rolled over sys.argv -- the CLI is small enough that argparse's
+    import and parser-construction cost would dominate startup.
+    """
+    args = SimpleNamespace(host="127.0.0.1", port=4318, session_dir="./sessions")
+    argv = sys.argv[1:]
+
+    i = 0
+    while i < len(argv):
+        token = argv[i]
+
+        # Split --flag=value form
+        if token.startswith("--") and "=" in token:
+            token, _, inline_value = token.partition("=")
+            value: str | None = inline_value
+        else:
+            value = None
+
+        if token in ("--help", "-h"):
+            print(_HELP_TEXT)
+            sys.exit(0)
+        elif token in ("--version", "-v"):
+            print(f"civ7-terminal {__version__}")
+            sys.exit(0)
+        elif token in ("--host", "-H", "--port", "-p", "--session-dir", "-s"):
+            if value is None:
+                i += 1
+                if i >= len(argv):
+                    _arg_error(f"argument {token}: expected one argument")
+                value = argv[i]
+
+            if token in ("--host", "-H"):
+                args.host = value
+            elif token in ("--port", "-p"):
+                # Validate bounds here so the value is converted and range
+                # checked exactly once, at the point of parsing.
+                try:
+                    port = int(value)
+                except ValueError:
+                    _arg_error(f"argument {token}: invalid int value: '{value}'")
+                if not 1 <= port <= 65535:
+                    print("Error: Port must be between 1 and 65535, got " + value, file=sys.stderr)
+                    sys.exit(1)
+                args.port = port
+            else:
+                args.session_dir = value
+        else:
+            _arg_error(f"unrecognized arguments: {token}")
+
+        i += 1
+
+    return args
+
+
+def ensure_session_dir(session_dir: str) -> None:
+    """Ensure the session directory exists."""
+    # Fast path: one stat() on the warm start where the directory exists
+    if os.path.isdir(session_dir):
+        return
+
+    try:
+        os.makedirs(session_dir, exist_ok=True)
+    except OSError as e:
+        print(
+            "Error: Cannot create session directory '" + session_dir + "': " + str(e),
+            file=sys.stderr,
+        )
+        sys.exit(1)
+
+
+def main() -> None:
+    """Main entry point."""
+    # Fast path for --version/--help: answer from sys.argv without paying
+    # the argparse import cost.
+    argv = sys.argv[1:]
+    if argv == ["-v"] or argv == ["--version"]:
+        print(f"civ7-terminal {__version__}")
+        sys.exit(0)
+    if "-h" in argv or "--help" in argv:
+        print(_HELP_TEXT)
+        sys.exit(0)
+
+    args = parse_args()
+
+    # Prewarm the heavy .app import in a background thread so it overlaps
+    # with the session-dir syscalls (the GIL is released during those).
+    # CIV7_NO_PREWARM=1 disables this for debugging import problems.
+    prewarm_thread = None
+    if not os.environ.get("CIV7_NO_PREWARM"):
+        import threading
+
+        def _prewarm() -> None:
+            try:
+                __import__("civ7_terminal.app")
+            except Exception:
+                pass  # Let the main-thread import report the real error
+
+        prewarm_thread = threading.Thread(target=_prewarm, daemon=True)
+        prewarm_thread.start()
+
+    # Ensure session directory exists
+    ensure_session_dir(args.session_dir)
+
+    if prewarm_thread is not None:
+        prewarm_thread.join()
+
+    # Import app here to avoid slow startup for --help/--version
+    from .app import Civ7TerminalApp
+
+    # Create and run the app
+    app = Civ7TerminalApp(
+        host=args.host,
+        port=args.port,
+        session_dir=args.session_dir,
+    )
+
+    def _excepthook(exc_type, exc, tb) -> None:
+        # Graceful exit on Ctrl+C during startup; short error line otherwise.
+        # The interpreter sets the non-zero exit status after the hook runs.
+        if exc_type is KeyboardInterrupt:
+            return
+        print("Error: " + str(exc), file=sys.stderr)
+
+    sys.excepthook = _excepthook
+    app.run()
@@ -8,41 +8,217 @@ from __future__ import annotations
 
 import json
 import logging
+import pickle
+import re
+from bisect import bisect_left
+from functools import lru_cache
 from pathlib import Path
+from typing import NamedTuple, Optional
+
+try:
+    import orjson  # noqa: F401 -- optional, 2-5x faster JSON parse
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+
+class TokenInfo(NamedTuple):
+    """The dotted token under the cursor and its flat start offset."""
+
+    token: str
+    start: int
 
 log = logging.getLogger(__name__)
 
+# Bump when the pickled cache layout changes
+_CACHE_VERSION = 3
+
+# Dotted identifier ending exactly at the cursor (anchored with \Z so the
+# regex engine scans the run once in C instead of a Python char loop)
+_TOKEN_RE = re.compile(r"[\w.]*\Z")
+
+
+def _build_prefix_trie(names) -> dict:
+    """Build a lowercase prefix trie over *names*.
+
+    Nodes are plain dicts keyed by character; each node stores, under the
+    ``None`` key, the (case-insensitively) sorted original-case names that
+    pass through it. Lookups are then an O(prefix-length) descent followed
+    by returning the presorted list -- no per-keystroke scan or sort.
+    """
+    ordered = sorted(names, key=str.lower)
+    root: dict = {None: ordered}
+    for name in ordered:
+        node = root
+        for ch in name.lower():
+            node = node.setdefault(ch, {})
+            node.setdefault(None, []).append(name)
+    return root
+
+
+class _MemberIndex(NamedTuple):
+    """Per-object member lookup structures built once at load time."""
+
+    pairs: list[tuple[str, str]]
+    all_names: tuple[str, ...]
+
+
+def _build_member_index(obj_data: dict) -> _MemberIndex:
+    """Build the ``(lowercase, original)`` pair list and all-names tuple.
+
+    Lowercasing and sorting happen once per object at load time so member
+    matching never calls ``str.lower`` or ``sorted`` per keystroke; the
+    all-names tuple serves the common bare ``Object.`` case without
+    building a fresh list.
+    """
+    pairs = [(name.lower(), name) for name in obj_data.get("methods", {})]
+    pairs += [(name.lower(), name) for name in obj_data.get("properties", {})]
+    pairs.sort()
+    return _MemberIndex(pairs, tuple(name for _, name in pairs))
+
+
+def _trie_lookup(root: dict, prefix_lower: str, limit: int) -> list[str]:
+    """Return up to *limit* presorted names under *prefix_lower*."""
+    node = root
+    for ch in prefix_lower:
+        child: Optional[dict] = node.get(ch)
+        if child is None:
+            return []
+        node = child
+    return list(node.get(None, ())[:limit])
+
 
 class CompletionEngine:
     """Provides tab-completion candidates and method signatures."""
 
+    __slots__ = (
+        "_globals",
+        "_sub_objects",
+        "_globals_trie",
+        "_sub_objects_trie",
+        "_global_members",
+        "_sub_members",
+        "_loaded",
+    )
+
     def __init__(self) -> None:
         self._globals: dict[str, dict] = {}
         self._sub_objects: dict[str, dict] = {}
+        self._globals_trie: dict = {}
+        self._sub_objects_trie: dict = {}
+        self._global_members: dict[str, _MemberIndex] = {}
+        self._sub_members: dict[str, _MemberIndex] = {}
         self._loaded: bool = False
 
-    def load(self, path: Path) -> bool:
+    def load(self, path: Path, use_cache: bool = True) -> bool:
         """Load completions data from a JSON file.
 
+        Keeps a pickled shadow cache next to the JSON (``*.cache.pkl``)
+        stamped with the JSON's (mtime, size) -- unpickling native dicts is
+        several times faster than re-parsing JSON on every startup, and the
+        cache also stores the prebuilt tries and member indexes so a warm
+        start skips index construction entirely. Pass ``use_cache=False``
+        to force a fresh JSON parse.
+
         Returns True if loaded successfully, False otherwise.
         """
+        cache_path = path.with_suffix(".cache.pkl")
+
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-        except (OSError, json.JSONDecodeError) as exc:
+            st = path.stat()
+        except OSError as exc:
+            log.warning("Failed to load completions from %s: %s", path, exc)
+            return False
+        stamp = (st.st_mtime_ns, st.st_size)
+
+        if use_cache and self._load_cache(cache_path, stamp):
+            return True
+
+        try:
+            raw = path.read_bytes()
+            # orjson.JSONDecodeError and json.JSONDecodeError are both
+            # ValueError subclasses, so one except clause covers both.
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        except (OSError, ValueError) as exc:
             log.warning("Failed to load completions from %s: %s", path, exc)
             return False
 
         self._globals = data.get("globals", {})
         self._sub_objects = data.get("sub_objects", {})
+        self._build_indexes()
         self._loaded = True
         log.info(
             "Loaded completions: %d globals, %d sub-objects",
             len(self._globals),
             len(self._sub_objects),
         )
+
+        if use_cache:
+            self._write_cache(cache_path, stamp)
         return True
 
+    def _load_cache(self, cache_path: Path, stamp: tuple[int, int]) -> bool:
+        """Try loading the pickled shadow cache. Returns True on a hit."""
+        try:
+            with open(cache_path, "rb") as f:
+                cached = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+            return False
+
+        if (
+            not isinstance(cached, dict)
+            or cached.get("version") != _CACHE_VERSION
+            or cached.get("stamp") != stamp
+        ):
+            return False
+
+        self._globals = cached["globals"]
+        self._sub_objects = cached["sub_objects"]
+        self._globals_trie = cached["globals_trie"]
+        self._sub_objects_trie = cached["sub_objects_trie"]
+        self._global_members = cached["global_members"]
+        self._sub_members = cached["sub_members"]
+        self._candidates_for.cache_clear()
+        self._loaded = True
+        log.info(
+            "Loaded completions from cache: %d globals, %d sub-objects",
+            len(self._globals),
+            len(self._sub_objects),
+        )
+        return True
+
+    def _write_cache(self, cache_path: Path, stamp: tuple[int, int]) -> None:
+        """Write the pickled shadow cache (best-effort)."""
+        try:
+            with open(cache_path, "wb") as f:
+                pickle.dump(
+                    {
+                        "version": _CACHE_VERSION,
+                        "stamp": stamp,
+                        "globals": self._globals,
+                        "sub_objects": self._sub_objects,
+                        "globals_trie": self._globals_trie,
+                        "sub_objects_trie": self._sub_objects_trie,
+                        "global_members": self._global_members,
+                        "sub_members": self._sub_members,
+                    },
+                    f,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+        except OSError as exc:
+            log.debug("Could not write completions cache %s: %s", cache_path, exc)
+
+    def _build_indexes(self) -> None:
+        """Build the prefix tries and member indexes for completion queries."""
+        self._candidates_for.cache_clear()
+        self._globals_trie = _build_prefix_trie(self._globals)
+        self._sub_objects_trie = _build_prefix_trie(self._sub_objects)
+        self._global_members = {
+            name: _build_member_index(data) for name, data in self._globals.items()
+        }
+        self._sub_members = {
+            name: _build_member_index(data) for name, data in self._sub_objects.items()
+        }
+
     @property
     def is_loaded(self) -> bool:
         """Whether completions data has been loaded."""
@@ -52,8 +228,18 @@ class CompletionEngine:
     # Completions
     # -----------------------------------------------------------------
 
-    def get_completions(self, text: str, cursor_pos: int) -> list[str]:
-        """Return completion candidates for the token at *cursor_pos*.
+    def get_completions(
+        self, text: str, cursor_pos: int, limit: int = 50
+    ) -> tuple[list[str], TokenInfo]:
+        """Return ``(candidates, token_info)`` for the token at *cursor_pos*.
+
+        At most *limit* candidates are returned -- cycling through more
+        than that is useless in the UI, and the cap lets broad prefixes
+        stop matching early instead of materialising every hit.
+
+        The token is extracted once here and handed back to the caller via
+        :class:`TokenInfo`, so the widget does not have to re-scan the
+        buffer to find the partial it is completing.
 
         Handles:
         1. Global name completion:  ``GameplayM|`` -> ``["GameplayMap"]``
@@ -63,38 +249,52 @@ class CompletionEngine:
         5. No match: ``zzz.|`` -> ``[]``
         """
         if not self._loaded:
-            return []
+            return [], TokenInfo("", cursor_pos)
 
         token = self._extract_token(text, cursor_pos)
+        info = TokenInfo(token, cursor_pos - len(token))
         if not token:
-            return []
+            return [], info
+
+        return list(self._candidates_for(token, limit)), info
+
+    @lru_cache(maxsize=256)
+    def _candidates_for(self, token: str, limit: int) -> tuple[str, ...]:
+        """Resolve completion candidates for an extracted dotted token.
+
+        Memoized: Tab-cycling and backspace-retype hit the same tokens
+        repeatedly, so recent results are served from the cache as
+        immutable tuples. The cache is cleared whenever indexes are
+        rebuilt. (The cache holds a reference to the engine, which is a
+        process-lifetime singleton, so that is not a leak here.)
+        """
+        return tuple(self._compute_candidates(token, limit))
 
+    def _compute_candidates(self, token: str, limit: int) -> list[str]:
+        """Compute completion candidates for an extracted dotted token."""
         parts = token.split(".")
 
         if len(parts) == 1:
             # Case 1: Global name prefix
-            prefix = parts[0].lower()
-            return sorted(
-                name
-                for name in self._globals
-                if name.lower().startswith(prefix)
-            )
+            return _trie_lookup(self._globals_trie, parts[0].lower(), limit)
 
         if len(parts) == 2:
             obj_name, member_prefix = parts
             member_prefix_lower = member_prefix.lower()
 
             # Case 2: method/property on a known global
-            if obj_name in self._globals:
-                return self._match_members(self._globals[obj_name], member_prefix_lower)
+            members = self._global_members.get(obj_name)
+            if members is not None:
+                return self._match_members(members, member_prefix_lower, limit)
 
             # Case 4: ``variable.SubObject`` -- the first part is a variable,
             # second part could be a sub-object name prefix OR already a
             # sub-object whose members we want.
             # First check if obj_name itself is a sub-object (unlikely at 2-part,
             # but handle ``Cities.get``).
-            if obj_name in self._sub_objects:
-                return self._match_members(self._sub_objects[obj_name], member_prefix_lower)
+            members = self._sub_members.get(obj_name)
+            if members is not None:
+                return self._match_members(members, member_prefix_lower, limit)
 
             # Otherwise the first part is an unknown variable, second part
             # could be a sub-object name prefix (``player.Cit`` -> ``Cities``).
@@ -102,11 +302,7 @@ class CompletionEngine:
             # on a bare ``zzz.`` input.
             if not member_prefix:
                 return []
-            return sorted(
-                name
-                for name in self._sub_objects
-                if name.lower().startswith(member_prefix_lower)
-            )
+            return _trie_lookup(self._sub_objects_trie, member_prefix_lower, limit)
 
         if len(parts) == 3:
             # Cases 3 & 4:  ``Game.Diplomacy.ha`` or ``player.Cities.get``
@@ -114,8 +310,9 @@ class CompletionEngine:
             member_prefix_lower = member_prefix.lower()
 
             # Try to resolve the sub-object
-            if sub_name in self._sub_objects:
-                return self._match_members(self._sub_objects[sub_name], member_prefix_lower)
+            members = self._sub_members.get(sub_name)
+            if members is not None:
+                return self._match_members(members, member_prefix_lower, limit)
 
             # Sub-name might also be a global (e.g. ``Game.Districts.get``)
             # ``Districts`` exists in both globals and sub_objects -- prefer sub_objects
@@ -178,29 +375,37 @@ class CompletionEngine:
     def _extract_token(text: str, cursor_pos: int) -> str:
         """Extract the dotted identifier token ending at *cursor_pos*.
 
-        Walks backwards from the cursor collecting alphanumeric, underscore,
-        and dot characters.
+        Matches the run of alphanumeric, underscore, and dot characters
+        ending at the cursor with a single anchored regex search.
         """
         # Clamp cursor_pos to text length
         cursor_pos = min(cursor_pos, len(text))
-
-        i = cursor_pos - 1
-        while i >= 0:
-            ch = text[i]
-            if ch.isalnum() or ch == "_" or ch == ".":
-                i -= 1
-            else:
-                break
-        return text[i + 1 : cursor_pos]
+        match = _TOKEN_RE.search(text, 0, cursor_pos)
+        # The pattern matches the empty string, so search never fails;
+        # the guard keeps the type checker satisfied
+        return match.group() if match is not None else ""
 
     @staticmethod
-    def _match_members(obj_data: dict, prefix_lower: str) -> list[str]:
-        """Return sorted method/property names matching *prefix_lower*."""
-        names: list[str] = []
-        for name in obj_data.get("methods", {}):
-            if name.lower().startswith(prefix_lower):
-                names.append(name)
-        for name in obj_data.get("properties", {}):
-            if name.lower().startswith(prefix_lower):
-                names.append(name)
-        return sorted(names)
+    def _match_members(index: _MemberIndex, prefix_lower: str, limit: int) -> list[str]:
+        """Return up to *limit* member names matching *prefix_lower*.
+
+        *index* holds a presorted ``(lowercase, original)`` pair list
+        built at load time. All matches form a contiguous run in the
+        sorted list, so we bisect to the start of the run and walk until
+        the prefix stops matching instead of testing every member. An
+        empty prefix returns the precomputed all-names tuple directly.
+        """
+        if not prefix_lower:
+            return list(index.all_names[:limit])
+
+        pairs = index.pairs
+        results: list[str] = []
+        i = bisect_left(pairs, (prefix_lower,))
+        n = len(pairs)
+        while i < n and len(results) < limit:
+            lower, name = pairs[i]
+            if not lower.startswith(prefix_lower):
+                break
+            results.append(name)
+            i += 1
+        return results
@@ -1,8 +1,9 @@
 """Async connection manager with auto-reconnect for Civ7 debug port."""
 
 import asyncio
+import socket
 from dataclasses import dataclass
-from enum import Enum, auto
+from enum import IntEnum
 from typing import Callable, Optional
 
 from .protocol import (
@@ -15,21 +16,22 @@ from .protocol import (
 )
 
 
-class ConnectionState(Enum):
+class ConnectionState(IntEnum):
     """Connection state enumeration."""
-    DISCONNECTED = auto()
-    CONNECTING = auto()
-    CONNECTED = auto()
+    DISCONNECTED = 0
+    CONNECTING = 1
+    CONNECTED = 2
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ConnectionConfig:
-    """Connection configuration."""
+    """Connection configuration (immutable once constructed)."""
     host: str = "127.0.0.1"
     port: int = 4318
     initial_retry_delay: float = 2.0
     max_retry_delay: float = 30.0
     retry_backoff_multiplier: float = 2.0
+    queue_maxsize: int = 256
 
 
 class ConnectionError(Exception):
@@ -69,21 +71,43 @@ class ConnectionManager:
         self._on_error = on_error
 
         self._state = ConnectionState.DISCONNECTED
-        self._reader: Optional[asyncio.StreamReader] = None
-        self._writer: Optional[asyncio.StreamWriter] = None
-
-        self._command_queue: asyncio.Queue[str] = asyncio.Queue()
-        self._pending_responses: asyncio.Queue[asyncio.Future[str]] = asyncio.Queue()
+        # Raw non-blocking socket driven with loop.sock_sendall/sock_recv;
+        # skips the StreamReader/StreamWriter buffering and flow-control
+        # layer, which this fixed-framing protocol does not need.
+        self._sock: Optional[socket.socket] = None
+
+        # Bounded so a long disconnect cannot grow the backlog (and its
+        # memory) without limit; senders back off in send_command instead.
+        self._command_queue: asyncio.Queue[tuple[int, str]] = asyncio.Queue(
+            maxsize=config.queue_maxsize
+        )
+        # Outstanding requests keyed by a monotonically increasing id.
+        # The wire protocol carries no correlation id, so responses are
+        # matched to the oldest outstanding request (dicts iterate in
+        # insertion order); keying by id lets a timed-out or cancelled
+        # request remove exactly its own entry instead of leaving a stale
+        # future to misalign every later response.
+        self._pending: dict[int, asyncio.Future[str]] = {}
+        self._next_request_id = 0
 
         self._retry_delay = config.initial_retry_delay
         self._shutdown_event = asyncio.Event()
+        # Gate for the persistent sender/receiver tasks: set while a live
+        # connection exists, cleared (with _connection_lost_event set) when
+        # it drops so _connection_loop can reconnect without respawning them.
+        self._connected_event = asyncio.Event()
+        self._connection_lost_event = asyncio.Event()
         self._connection_task: Optional[asyncio.Task] = None
         self._sender_task: Optional[asyncio.Task] = None
         self._receiver_task: Optional[asyncio.Task] = None
 
-        # Dedup repeated error messages
+        # Dedup repeated error messages; repeats are debounced so a
+        # tight failure loop produces at most one "(xN)" UI update per
+        # flush interval instead of one callback per failure.
         self._last_error_msg: Optional[str] = None
         self._error_count: int = 0
+        self._error_pending: int = 0
+        self._error_flush_handle: Optional[asyncio.TimerHandle] = None
 
     @property
     def state(self) -> ConnectionState:
@@ -101,19 +125,48 @@ class ConnectionManager:
         if self._on_state_change:
             self._on_state_change(state, retry_countdown)
 
+    # Minimum seconds between "(xN)" updates for a repeated error
+    _ERROR_FLUSH_INTERVAL = 0.25
+
     def _notify_error(self, message: str) -> None:
-        """Notify error callback, collapsing repeated identical messages."""
+        """Notify error callback, collapsing repeated identical messages.
+
+        The first occurrence of a message goes through immediately; each
+        repeat only bumps a counter, and the "(xN)" line is refreshed at
+        most once per _ERROR_FLUSH_INTERVAL via a timer.
+        """
         if not self._on_error:
             return
 
         if message == self._last_error_msg:
             self._error_count += 1
-            self._on_error(f"{message} (x{self._error_count})", True)
+            self._error_pending += 1
+            if self._error_flush_handle is None:
+                self._error_flush_handle = asyncio.get_event_loop().call_later(
+                    self._ERROR_FLUSH_INTERVAL, self._flush_errors
+                )
         else:
+            # New message: settle the repeat count of the previous one
+            # first so its final "(xN)" is not lost.
+            if self._error_flush_handle is not None:
+                self._error_flush_handle.cancel()
+                self._error_flush_handle = None
+            self._flush_pending_error()
             self._last_error_msg = message
             self._error_count = 1
             self._on_error(message, False)
 
+    def _flush_errors(self) -> None:
+        """Timer callback: deliver the accumulated repeat count."""
+        self._error_flush_handle = None
+        self._flush_pending_error()
+
+    def _flush_pending_error(self) -> None:
+        """Deliver the pending "(xN)" update, if any."""
+        if self._error_pending and self._on_error and self._last_error_msg:
+            self._on_error(f"{self._last_error_msg} (x{self._error_count})", True)
+        self._error_pending = 0
+
     def _notify_response(self, response: str) -> None:
         """Notify response callback."""
         if self._on_response:
@@ -125,12 +178,22 @@ class ConnectionManager:
             return
 
         self._shutdown_event.clear()
+        self._connected_event.clear()
         self._connection_task = asyncio.create_task(self._connection_loop())
+        # Sender and receiver live for the manager's whole lifetime and
+        # park on _connected_event between connections, so a reconnect
+        # does not churn task objects.
+        self._sender_task = asyncio.create_task(self._sender_loop())
+        self._receiver_task = asyncio.create_task(self._receiver_loop())
 
     async def stop(self) -> None:
         """Stop the connection manager and close connection."""
         self._shutdown_event.set()
 
+        if self._error_flush_handle is not None:
+            self._error_flush_handle.cancel()
+            self._error_flush_handle = None
+
         # Cancel all tasks
         for task in [self._sender_task, self._receiver_task, self._connection_task]:
             if task is not None:
@@ -159,110 +222,172 @@ class ConnectionManager:
         if not javascript.strip():
             return None
 
-        # Create a future for the response
+        # Create a future for the response, keyed by request id
+        request_id = self._next_request_id
+        self._next_request_id += 1
         response_future: asyncio.Future[str] = asyncio.get_event_loop().create_future()
-
-        # Queue the command and its response future
-        await self._command_queue.put(javascript)
-        await self._pending_responses.put(response_future)
+        self._pending[request_id] = response_future
 
         try:
+            try:
+                # asyncio.timeout reuses one timer on the enclosing task
+                # instead of wrapping the await in a watchdog task the
+                # way wait_for does
+                async with asyncio.timeout(2.0):
+                    await self._command_queue.put((request_id, javascript))
+            except TimeoutError:
+                self._notify_error("Command queue full, command dropped")
+                return None
             # Wait for response with timeout
-            response = await asyncio.wait_for(response_future, timeout=30.0)
-            return response
-        except asyncio.TimeoutError:
+            async with asyncio.timeout(30.0):
+                return await response_future
+        except TimeoutError:
             self._notify_error("Command timed out waiting for response")
             return None
         except asyncio.CancelledError:
             return None
+        finally:
+            self._pending.pop(request_id, None)
 
-    async def _connection_loop(self) -> None:
-        """Main connection loop with auto-reconnect."""
-        while not self._shutdown_event.is_set():
-            try:
-                await self._connect()
+    def _signal_connection_lost(self) -> None:
+        """Tell the connection loop the live connection has dropped."""
+        if self._connected_event.is_set():
+            self._connected_event.clear()
+            self._connection_lost_event.set()
+
+    @staticmethod
+    async def _race_stop(coro, stop_task: asyncio.Task) -> Optional[asyncio.Task]:
+        """Run *coro* raced against shutdown.
 
-                if self._state == ConnectionState.CONNECTED:
-                    # Reset retry delay and error dedup on successful connection
-                    self._retry_delay = self.config.initial_retry_delay
-                    self._last_error_msg = None
-                    self._error_count = 0
+        Returns the finished task for *coro*, or None if shutdown won
+        (in which case *coro* is cancelled before it could complete).
+        """
+        task = asyncio.create_task(coro)
+        try:
+            done, _ = await asyncio.wait(
+                {task, stop_task},
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+        except asyncio.CancelledError:
+            task.cancel()
+            raise
+        if task not in done:
+            task.cancel()
+            return None
+        return task
 
-                    # Start sender and receiver tasks
-                    self._sender_task = asyncio.create_task(self._sender_loop())
-                    self._receiver_task = asyncio.create_task(self._receiver_loop())
+    async def _connection_loop(self) -> None:
+        """Main connection loop with auto-reconnect."""
+        stop_task = asyncio.create_task(self._shutdown_event.wait())
+        try:
+            while not self._shutdown_event.is_set():
+                try:
+                    await self._connect()
+                except asyncio.CancelledError:
+                    break
+                except Exception as e:
+                    self._notify_error(f"Connection failed: {e}")
+                    await self._close_connection()
+                    if self._shutdown_event.is_set():
+                        break
+                    await self._wait_for_retry()
+                    continue
 
-                    # Wait for either task to complete (indicating disconnection)
-                    done, pending = await asyncio.wait(
-                        [self._sender_task, self._receiver_task],
+                # Reset retry delay and error dedup on successful connection
+                self._retry_delay = self.config.initial_retry_delay
+                self._last_error_msg = None
+                self._error_count = 0
+                self._error_pending = 0
+
+                # Wake the parked sender/receiver, then sleep until the
+                # connection drops (or we are stopped).
+                self._connection_lost_event.clear()
+                self._connected_event.set()
+                lost_task = asyncio.create_task(self._connection_lost_event.wait())
+                try:
+                    await asyncio.wait(
+                        {lost_task, stop_task},
                         return_when=asyncio.FIRST_COMPLETED,
                     )
+                finally:
+                    lost_task.cancel()
+                self._connected_event.clear()
 
-                    # Cancel remaining tasks
-                    for task in pending:
-                        task.cancel()
-                        try:
-                            await task
-                        except asyncio.CancelledError:
-                            pass
-
-                    # Check for exceptions
-                    for task in done:
-                        try:
-                            task.result()
-                        except Exception as e:
-                            self._notify_error(f"Connection error: {e}")
-
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                self._notify_error(f"Connection failed: {e}")
-
-            # Clean up connection
-            await self._close_connection()
+                # Clean up connection
+                await self._close_connection()
 
-            if self._shutdown_event.is_set():
-                break
+                if self._shutdown_event.is_set():
+                    break
 
-            # Wait before retry with countdown
-            await self._wait_for_retry()
+                # Wait before retry with countdown
+                await self._wait_for_retry()
+        finally:
+            stop_task.cancel()
 
     async def _connect(self) -> None:
         """Establish connection to the debug port."""
         self._set_state(ConnectionState.CONNECTING)
 
+        loop = asyncio.get_running_loop()
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setblocking(False)
         try:
-            self._reader, self._writer = await asyncio.wait_for(
-                asyncio.open_connection(self.config.host, self.config.port),
-                timeout=10.0,
-            )
-            self._set_state(ConnectionState.CONNECTED)
-        except asyncio.TimeoutError:
+            async with asyncio.timeout(10.0):
+                await loop.sock_connect(sock, (self.config.host, self.config.port))
+        except TimeoutError:
+            sock.close()
             raise ConnectionError("Connection timed out")
         except OSError as e:
+            sock.close()
             raise ConnectionError(f"Failed to connect: {e}")
 
+        # Latency and liveness tuning: disable Nagle so small command
+        # frames are not held back waiting for an ACK, and enable
+        # keepalive so a vanished game process is detected even while we
+        # sit idle in sock_recv. The keepalive knobs are platform-
+        # specific, hence the hasattr guards; all of it is best-effort.
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            if hasattr(socket, "TCP_KEEPIDLE"):
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 10)
+            if hasattr(socket, "TCP_KEEPINTVL"):
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 5)
+            if hasattr(socket, "TCP_KEEPCNT"):
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 3)
+            # Large kernel buffers so a big response (a JSON dump of the
+            # whole map, say) streams in without the sender stalling on
+            # a full window; the kernel clamps these to its own limits
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 4 * 1024 * 1024)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4 * 1024 * 1024)
+        except OSError:
+            pass
+
+        self._sock = sock
+        self._set_state(ConnectionState.CONNECTED)
+
     async def _close_connection(self) -> None:
         """Close the current connection."""
-        if self._writer is not None:
+        if self._sock is not None:
+            # shutdown() wakes a receiver blocked in sock_recv with EOF
+            # before the descriptor goes away
+            try:
+                self._sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
             try:
-                self._writer.close()
-                await self._writer.wait_closed()
-            except Exception:
-                pass  # Ignore errors during close
-            self._writer = None
-            self._reader = None
+                self._sock.close()
+            except OSError:
+                pass
+            self._sock = None
 
         self._set_state(ConnectionState.DISCONNECTED)
 
         # Fail any pending response futures
-        while not self._pending_responses.empty():
-            try:
-                future = self._pending_responses.get_nowait()
-                if not future.done():
-                    future.cancel()
-            except asyncio.QueueEmpty:
-                break
+        for future in self._pending.values():
+            if not future.done():
+                future.cancel()
+        self._pending.clear()
 
     async def _wait_for_retry(self) -> None:
         """Wait for retry with countdown updates."""
@@ -271,12 +396,10 @@ class ConnectionManager:
         while remaining > 0 and not self._shutdown_event.is_set():
             self._set_state(ConnectionState.DISCONNECTED, remaining)
             try:
-                await asyncio.wait_for(
-                    self._shutdown_event.wait(),
-                    timeout=min(1.0, remaining),
-                )
+                async with asyncio.timeout(min(1.0, remaining)):
+                    await self._shutdown_event.wait()
                 break
-            except asyncio.TimeoutError:
+            except TimeoutError:
                 remaining -= 1.0
 
         # Increase retry delay with backoff
@@ -286,66 +409,127 @@ class ConnectionManager:
         )
 
     async def _sender_loop(self) -> None:
-        """Send queued commands."""
-        while not self._shutdown_event.is_set():
-            try:
-                # Wait for command with timeout to allow checking shutdown
-                try:
-                    command = await asyncio.wait_for(
-                        self._command_queue.get(),
-                        timeout=1.0,
-                    )
-                except asyncio.TimeoutError:
-                    continue
+        """Send queued commands.
 
-                if self._writer is None:
+        Runs for the manager's whole lifetime: parks on _connected_event
+        while disconnected, then blocks on the queue raced against a
+        single long-lived shutdown-wait task -- no periodic polling and
+        no task churn across reconnects.
+        """
+        stop_task = asyncio.create_task(self._shutdown_event.wait())
+        try:
+            while not self._shutdown_event.is_set():
+                if not self._connected_event.is_set():
+                    if await self._race_stop(self._connected_event.wait(), stop_task) is None:
+                        break
                     continue
 
-                # Encode and send command
-                data = encode_command(command)
-                self._writer.write(data)
-                await self._writer.drain()
-
-            except asyncio.CancelledError:
-                raise
-            except Exception as e:
-                self._notify_error(f"Send error: {e}")
-                raise
-
-    async def _receiver_loop(self) -> None:
-        """Receive and process responses."""
-        while not self._shutdown_event.is_set():
-            try:
-                if self._reader is None:
+                get_task = await self._race_stop(self._command_queue.get(), stop_task)
+                if get_task is None:
+                    # Shutdown fired; the get was not satisfied so no
+                    # command is lost by cancelling it.
                     break
 
-                # Read header
-                header = await self._reader.readexactly(HEADER_SIZE)
-                length, msg_type = decode_header(header)
+                _request_id, command = get_task.result()
 
-                # Read payload
-                payload = await self._reader.readexactly(length)
-                message = decode_message(header, payload)
+                sock = self._sock
+                if sock is None:
+                    continue
 
-                # Notify response callback
-                self._notify_response(message.payload)
+                # Drain any further queued commands and flush the whole
+                # batch with a single sock_sendall instead of one per
+                # command.
+                batch = [command]
+                while True:
+                    try:
+                        _request_id, extra = self._command_queue.get_nowait()
+                    except asyncio.QueueEmpty:
+                        break
+                    batch.append(extra)
 
-                # Complete pending response future
                 try:
-                    future = self._pending_responses.get_nowait()
-                    if not future.done():
-                        future.set_result(message.payload)
-                except asyncio.QueueEmpty:
-                    pass  # Unsolicited response
-
-            except asyncio.IncompleteReadError:
-                # Connection closed
-                break
-            except asyncio.CancelledError:
-                raise
-            except ProtocolError as e:
-                self._notify_error(f"Protocol error: {e}")
-                raise
-            except Exception as e:
-                self._notify_error(f"Receive error: {e}")
-                raise
+                    data = b"".join(encode_command(cmd) for cmd in batch)
+                    await asyncio.get_running_loop().sock_sendall(sock, data)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    self._notify_error(f"Send error: {e}")
+                    if sock is self._sock:
+                        self._signal_connection_lost()
+        finally:
+            stop_task.cancel()
+
+    async def _receiver_loop(self) -> None:
+        """Receive and process responses.
+
+        Runs for the manager's whole lifetime, parked on _connected_event
+        while disconnected. Reads the socket in large chunks into a
+        reassembly buffer and decodes every complete frame it holds,
+        rather than issuing two readexactly calls per message. Small
+        responses arriving together cost one read; a frame split across
+        chunks is finished by the next read.
+        """
+        stop_task = asyncio.create_task(self._shutdown_event.wait())
+        try:
+            while not self._shutdown_event.is_set():
+                if not self._connected_event.is_set():
+                    if await self._race_stop(self._connected_event.wait(), stop_task) is None:
+                        break
+                    continue
+
+                sock = self._sock
+                if sock is None:
+                    # Lost the connection between the gate and here; let
+                    # the connection loop run and re-park.
+                    await asyncio.sleep(0)
+                    continue
+
+                loop = asyncio.get_running_loop()
+                buffer = bytearray()
+                while not self._shutdown_event.is_set():
+                    try:
+                        chunk = await loop.sock_recv(sock, 65536)
+                    except asyncio.CancelledError:
+                        raise
+                    except Exception as e:
+                        if sock is self._sock:
+                            self._notify_error(f"Receive error: {e}")
+                        chunk = b""
+                    if not chunk:
+                        # Connection closed (ignore EOF from a stale
+                        # socket after a reconnect already happened)
+                        if sock is self._sock:
+                            self._signal_connection_lost()
+                        break
+                    buffer += chunk
+
+                    try:
+                        # Decode every complete frame in the buffer
+                        while len(buffer) >= HEADER_SIZE:
+                            length, msg_type = decode_header(buffer)
+                            frame_end = HEADER_SIZE + length
+                            if len(buffer) < frame_end:
+                                break
+                            message = decode_message(
+                                bytes(buffer[:HEADER_SIZE]),
+                                bytes(buffer[HEADER_SIZE:frame_end]),
+                            )
+                            del buffer[:frame_end]
+
+                            # Notify response callback
+                            self._notify_response(message.payload)
+
+                            # Complete the oldest outstanding request, if any
+                            if self._pending:
+                                request_id = next(iter(self._pending))
+                                future = self._pending.pop(request_id)
+                                if not future.done():
+                                    future.set_result(message.payload)
+                            # Otherwise: unsolicited response
+                    except ProtocolError as e:
+                        self._notify_error(f"Protocol error: {e}")
+                        if sock is self._sock:
+                            self._signal_connection_lost()
+                        break
+        finally:
+            stop_task.cancel()
@@ -11,11 +11,35 @@ Usage:
 import argparse
 import json
 import os
+import pickle
 import re
 import sys
 import time
+from collections.abc import Iterator
 from pathlib import Path
 
+try:
+    import orjson  # optional, several times faster on multi-MB source maps
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None  # type: ignore[assignment]
+
+if msgspec is not None:
+    # The one source-map field we read: msgspec skips keys not declared
+    # on the Struct, so the large mappings/names/sources arrays are
+    # never materialized. Built with defstruct rather than a class
+    # statement because mypyc cannot compile conditional class bodies.
+    _SourceMap = msgspec.defstruct(
+        "_SourceMap", [("sourcesContent", list[str | None], [])]
+    )
+    _MAP_DECODER = msgspec.json.Decoder(_SourceMap)
+else:
+    _MAP_DECODER = None
+
 
 # ---------------------------------------------------------------------------
 # Known globals to extract members for
@@ -122,123 +146,265 @@ def find_game_dir() -> Path | None:
     return None
 
 
-def find_source_maps(game_dir: Path) -> list[Path]:
-    """Find all .js.map files in the game directory."""
-    maps = []
-    for root, _dirs, files in os.walk(game_dir):
-        for f in files:
-            if f.endswith(".js.map"):
-                maps.append(Path(root) / f)
-    return maps
-
+def find_source_maps(game_dir: Path):
+    """Yield all .js.map files in the game directory.
 
-def extract_typescript_sources(map_files: list[Path]) -> list[str]:
-    """Extract TypeScript source content from source map files."""
-    sources = []
-    errors = 0
-    for map_file in map_files:
+    Walks with os.scandir directly: entry objects already know whether
+    they are directories (no extra stat call per path), and yielding as
+    we go avoids building the full list before the caller can start.
+    """
+    stack = [os.fspath(game_dir)]
+    while stack:
+        current = stack.pop()
         try:
-            with open(map_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-        except (json.JSONDecodeError, UnicodeDecodeError, OSError):
-            errors += 1
+            entries = os.scandir(current)
+        except OSError:
             continue
+        with entries:
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    continue
+                if is_dir:
+                    stack.append(entry.path)
+                elif entry.name.endswith(".js.map"):
+                    yield Path(entry.path)
+
+
+def _load_map_contents(map_file):
+    """Read and decode one map file; returns sourcesContent or None on error."""
+    try:
+        # Read bytes: orjson takes bytes directly, and stdlib json
+        # decodes UTF-8 itself -- either way we skip a text-mode pass.
+        with open(map_file, "rb") as f:
+            raw = f.read()
+        if _MAP_DECODER is not None:
+            # Typed decode: only sourcesContent is parsed out
+            return _MAP_DECODER.decode(raw).sourcesContent
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        return data.get("sourcesContent", [])
+    except (ValueError, OSError):
+        return None
+
+
+def _usable_sources(contents):
+    """Filter decoded sourcesContent down to TypeScript-like entries."""
+    for content in contents:
+        if content and len(content) > 50:
+            # Only include TypeScript-like content (skip HTML, CSS, etc.)
+            if _looks_like_typescript(content):
+                yield content
 
-        for content in data.get("sourcesContent", []):
-            if content and len(content) > 50:
-                # Only include TypeScript-like content (skip HTML, CSS, etc.)
-                if _looks_like_typescript(content):
-                    sources.append(content)
+
+def extract_typescript_sources(map_files) -> Iterator[str]:
+    """Yield TypeScript source content from source map files.
+
+    Yielding as each map is parsed means the caller never holds the
+    whole corpus at once -- peak memory is a few source maps plus
+    whatever the consumer keeps, not the sum of every extracted source.
+    Reads and decodes run on a thread pool so OS read-ahead overlaps
+    parsing (file reads release the GIL); a bounded in-flight window
+    keeps the streaming property.
+    """
+    from collections import deque
+    from concurrent.futures import ThreadPoolExecutor
+
+    errors = 0
+    max_workers = min(32, 4 * (os.cpu_count() or 1))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending: deque = deque()
+
+        def drain_one():
+            nonlocal errors
+            contents = pending.popleft().result()
+            if contents is None:
+                errors += 1
+                return ()
+            return _usable_sources(contents)
+
+        for map_file in map_files:
+            pending.append(executor.submit(_load_map_contents, map_file))
+            if len(pending) >= 2 * max_workers:
+                yield from drain_one()
+        while pending:
+            yield from drain_one()
 
     if errors:
         print(f"  Warning: {errors} map files had parse errors (skipped)")
-    return sources
+
+
+# Common TS/JS patterns, as one alternation so acceptance is a single
+# compiled scan instead of seven substring passes
+_TS_INDICATORS = re.compile(
+    r"function|const |let |import |export |class |interface "
+)
 
 
 def _looks_like_typescript(content: str) -> bool:
     """Heuristic check if content looks like TypeScript/JavaScript."""
+    stripped = content.strip()
     # Skip HTML templates
-    if content.strip().startswith(("<", "export default \"<")):
+    if stripped.startswith(("<", "export default \"<")):
         return False
     # Skip CSS
-    if content.strip().startswith(("@", ".")) and "{" in content[:200] and "function" not in content[:500]:
+    if stripped.startswith(("@", ".")) and "{" in content[:200] and "function" not in content[:500]:
         return False
-    # Accept anything with common TS/JS patterns
-    indicators = ["function", "const ", "let ", "import ", "export ", "class ", "interface "]
-    snippet = content[:1000]
-    return any(ind in snippet for ind in indicators)
+    # Accept anything with a common TS/JS pattern in the first 1000 chars
+    return _TS_INDICATORS.search(content, 0, 1000) is not None
 
 
 # ---------------------------------------------------------------------------
 # Regex patterns for extraction
+#
+# Each category uses ONE master pattern with an alternation over every known
+# name, so a source blob is scanned once per category (6 passes total)
+# instead of once per name per category (~180 passes). The matched name is
+# a capture group and dispatches to the right entry during extraction.
+# Alternatives are ordered longest-first so "GameplayMap" wins over "Game"
+# without backtracking.
 # ---------------------------------------------------------------------------
 
-def _build_global_typed_call_pattern(global_name: str) -> re.Pattern:
-    """Match typed Global.method(args) calls where the call is the direct RHS.
+try:
+    import re2 as _re2  # google-re2: DFA execution, no backtracking blowups
+except ImportError:
+    _re2 = None  # type: ignore[assignment]
 
-    Only captures return type when the method call is the complete assignment value,
-    i.e. followed by a semicolon (not by operators like ==, +, ?, etc.).
-    """
-    return re.compile(
-        r'(?:const|let|var)\s+\w+\s*:\s*([\w\[\]|<>, ]+?)\s*=\s*'
-        + re.escape(global_name)
-        + r'\.([\w]+)\s*\(([^)]*)\)\s*[;\n]'
-    )
+try:
+    import ahocorasick  # optional: one linear multi-pattern sweep per source
+except ImportError:
+    ahocorasick = None  # type: ignore[assignment]
 
 
-def _build_global_call_pattern(global_name: str) -> re.Pattern:
-    """Match Global.method(args) calls (without type extraction)."""
-    return re.compile(
-        r'(?<![.\w])'
-        + re.escape(global_name)
-        + r'\.([\w]+)\s*\(([^)]*)\)'
-    )
-
-
-def _build_global_property_pattern(global_name: str) -> re.Pattern:
-    """Match Global.property access (no parens)."""
-    # Matches: Global.prop (not followed by '(' which would be a method call)
-    # The \b ensures we match the full identifier and don't backtrack into a
-    # partial match of a method name (e.g. 'getGridWidt' from 'getGridWidth()')
-    return re.compile(
-        r'(?:(?:const|let|var)\s+\w+\s*:\s*([\w\[\]|<>, ]+?)\s*=\s*)?'
-        + r'(?<![.\w])'
-        + re.escape(global_name)
-        + r'\.([\w]+)\b(?!\s*\()'
-    )
-
-
-def _build_sub_object_typed_call_pattern(sub_name: str) -> re.Pattern:
-    """Match typed *.SubObject.method(args) calls where the call is the direct RHS."""
-    return re.compile(
-        r'(?:const|let|var)\s+\w+\s*:\s*([\w\[\]|<>, ]+?)\s*=\s*'
-        r'\w+\.'
-        + re.escape(sub_name)
-        + r'\.([\w]+)\s*\(([^)]*)\)\s*[;\n]'
-    )
-
-
-def _build_sub_object_call_pattern(sub_name: str) -> re.Pattern:
-    """Match *.SubObject.method(args) calls (without type extraction)."""
-    # Matches patterns like:
-    #   player.Cities.getCities()
-    #   Game.Diplomacy.hasMet(id1, id2)
-    #   p.Units.getUnits()
-    return re.compile(
-        r'\w+\.'
-        + re.escape(sub_name)
-        + r'\.([\w]+)\s*\(([^)]*)\)'
-    )
-
+def _compile(expr: str):
+    """Compile *expr* with google-re2 when available, else stdlib re.
 
-def _build_sub_object_property_pattern(sub_name: str) -> re.Pattern:
-    """Match *.SubObject.property access (no parens)."""
-    return re.compile(
-        r'(?:(?:const|let|var)\s+\w+\s*:\s*([\w\[\]|<>, ]+?)\s*=\s*)?'
-        r'\w+\.'
-        + re.escape(sub_name)
-        + r'\.([\w]+)\b(?!\s*\()'
-    )
+    re2 executes as a DFA, which is markedly faster on multi-megabyte
+    inputs and immune to backtracking pathologies from constructs like
+    ``[^)]*``. It does not support look-around, so the patterns that use
+    ``(?<!...)``/``(?!...)`` fall back to stdlib re per-pattern.
+    """
+    if _re2 is not None:
+        try:
+            return _re2.compile(expr)
+        except Exception:
+            pass
+    return re.compile(expr)
+
+
+def _alternation(names: list[str]) -> str:
+    """Build a longest-first regex alternation over *names*."""
+    return "|".join(re.escape(n) for n in sorted(names, key=len, reverse=True))
+
+
+_GLOBAL_ALT = _alternation(KNOWN_GLOBALS)
+_SUB_ALT = _alternation(KNOWN_SUB_OBJECTS)
+
+# Typed Global.method(args) calls where the call is the direct RHS. Only
+# captures the return type when the method call is the complete assignment
+# value, i.e. followed by a semicolon (not by operators like ==, +, ?, etc.).
+GLOBAL_TYPED_CALL = _compile(
+    r'(?:const|let|var)\s+\w+\s*:\s*([\w\[\]|<>, ]+?)\s*=\s*'
+    r'(' + _GLOBAL_ALT + r')'
+    r'\.([\w]+)\s*\(([^)]*)\)\s*[;\n]'
+)
+
+# Global.method(args) calls (without type extraction)
+GLOBAL_CALL = _compile(
+    r'(?<![.\w])'
+    r'(' + _GLOBAL_ALT + r')'
+    r'\.([\w]+)\s*\(([^)]*)\)'
+)
+
+# Global.property access (no parens). The \b ensures we match the full
+# identifier and don't backtrack into a partial match of a method name
+# (e.g. 'getGridWidt' from 'getGridWidth()').
+GLOBAL_PROP = _compile(
+    r'(?:(?:const|let|var)\s+\w+\s*:\s*([\w\[\]|<>, ]+?)\s*=\s*)?'
+    r'(?<![.\w])'
+    r'(' + _GLOBAL_ALT + r')'
+    r'\.([\w]+)\b(?!\s*\()'
+)
+
+# Typed *.SubObject.method(args) calls where the call is the direct RHS
+SUB_TYPED_CALL = _compile(
+    r'(?:const|let|var)\s+\w+\s*:\s*([\w\[\]|<>, ]+?)\s*=\s*'
+    r'\w+\.'
+    r'(' + _SUB_ALT + r')'
+    r'\.([\w]+)\s*\(([^)]*)\)\s*[;\n]'
+)
+
+# *.SubObject.method(args) calls, e.g. player.Cities.getCities() or
+# Game.Diplomacy.hasMet(id1, id2)
+SUB_CALL = _compile(
+    r'\w+\.'
+    r'(' + _SUB_ALT + r')'
+    r'\.([\w]+)\s*\(([^)]*)\)'
+)
+
+# *.SubObject.property access (no parens)
+SUB_PROP = _compile(
+    r'(?:(?:const|let|var)\s+\w+\s*:\s*([\w\[\]|<>, ]+?)\s*=\s*)?'
+    r'\w+\.'
+    r'(' + _SUB_ALT + r')'
+    r'\.([\w]+)\b(?!\s*\()'
+)
+
+
+_IDENT_RE = re.compile(r"\w+\Z")
+_LITERAL_KEYWORDS = frozenset(("true", "false", "null", "undefined", "this"))
+
+
+def _classify_param(
+    args_str: str,
+    start: int,
+    end: int,
+    first_colon: int,
+    colon_space: int,
+    last_dot: int,
+    has_bracket: bool,
+    has_operator: bool,
+    ordinal: int,
+) -> str:
+    """Turn one scanned argument token into a parameter name.
+
+    *start*/*end* bound the token's non-space extent in *args_str*;
+    the remaining arguments are facts gathered during the scan.
+    """
+    p = args_str[start:end]
+
+    # Typed parameter (formal): 'name: Type'. The ': ' marker must fall
+    # inside the token (a trailing one would have been stripped), and the
+    # name is whatever precedes the token's first colon.
+    if colon_space != -1 and colon_space + 1 < end:
+        candidate = args_str[start:first_colon].strip().rstrip("?")
+        # Only treat as typed param if the name part is a simple identifier;
+        # otherwise it's a ternary or complex expression
+        if _IDENT_RE.fullmatch(candidate):
+            return candidate
+        return "arg" + str(ordinal)
+
+    # Call-site argument - try to get a meaningful name.
+    # Skip literals: strings, numbers, booleans, null/undefined
+    if p[0] in "\"'`":
+        return "arg" + str(ordinal)
+    if p in _LITERAL_KEYWORDS:
+        return "arg" + str(ordinal)
+    if p.lstrip("-").replace(".", "", 1).isdigit():
+        return "arg" + str(ordinal)
+    # Function calls, array access, object literals: foo(), arr[i], { x: 1 }
+    if has_bracket:
+        return "arg" + str(ordinal)
+    # Property access chains: use the last part, plotCoord.x -> x
+    if last_dot != -1:
+        return args_str[last_dot + 1:end]
+    # ALL_CAPS constants are not param names
+    if p.isupper() or (p.replace("_", "").isupper() and "_" in p):
+        return "arg" + str(ordinal)
+    # Ternary/conditional/comparison expressions
+    if has_operator:
+        return "arg" + str(ordinal)
+    return p
 
 
 def _extract_param_names(args_str: str) -> list[str]:
@@ -247,78 +413,68 @@ def _extract_param_names(args_str: str) -> list[str]:
     For something like 'plotCoord.x, plotCoord.y' we return ['x', 'y'].
     For 'iX, iY' we return ['iX', 'iY'].
     For typed params like 'x: number, y: number' we return ['x', 'y'].
-    """
-    if not args_str.strip():
-        return []
 
-    params = []
-    # Split by comma, handling nested braces/brackets
+    Scans the string once, tracking per-token facts (extent, first
+    ': ' typed marker, last dot, bracket/operator sightings) instead of
+    splitting and re-scanning each token with string methods. This is
+    called on every regex match across the whole corpus, so the
+    constant factor matters.
+    """
+    clean_params: list[str] = []
     depth = 0
-    current = ""
-    for ch in args_str:
+    # Per-token state, reset after each top-level comma
+    start = -1          # first non-space index of the token
+    end = -1            # one past the last non-space index
+    first_colon = -1    # index of the first ':' in the token
+    colon_space = -1    # index of the first ':' directly followed by ' '
+    last_dot = -1
+    has_bracket = False
+    has_operator = False
+    prev_was_colon = False
+
+    for i, ch in enumerate(args_str):
+        if ch == "," and depth == 0:
+            if start != -1:
+                clean_params.append(
+                    sys.intern(_classify_param(
+                        args_str, start, end, first_colon, colon_space,
+                        last_dot, has_bracket, has_operator, len(clean_params),
+                    ))
+                )
+            start = end = first_colon = colon_space = last_dot = -1
+            has_bracket = has_operator = prev_was_colon = False
+            continue
+        if prev_was_colon and ch == " " and colon_space == -1:
+            colon_space = i - 1
+        prev_was_colon = ch == ":"
+        if ch.isspace():
+            continue
+        if start == -1:
+            start = i
+        end = i + 1
+        if ch == ":" and first_colon == -1:
+            first_colon = i
         if ch in "({[":
             depth += 1
-            current += ch
+            has_bracket = True
         elif ch in ")}]":
             depth -= 1
-            current += ch
-        elif ch == "," and depth == 0:
-            params.append(current.strip())
-            current = ""
-        else:
-            current += ch
-    if current.strip():
-        params.append(current.strip())
+        elif ch == ".":
+            last_dot = i
+        elif ch in "?!=<>":
+            has_operator = True
 
     # If parens were unbalanced (truncated by [^)]*), discard all params
     if depth != 0:
         return []
 
-    # Clean up parameter names
-    clean_params = []
-    for p in params:
-        p = p.strip()
-        if not p:
-            continue
-
-        # If it's a typed parameter (formal): 'name: Type'
-        if ": " in p:
-            candidate = p.split(":")[0].strip().rstrip("?")
-            # Only treat as typed param if the name part is a simple identifier
-            if re.match(r'^\w+$', candidate):
-                clean_params.append(candidate)
-            else:
-                # Ternary or complex expression, not a typed param
-                clean_params.append("arg" + str(len(clean_params)))
-            continue
-        else:
-            # It's a call-site argument - try to get a meaningful name
-            # Skip literals: strings, numbers, booleans, null/undefined
-            if p.startswith('"') or p.startswith("'") or p.startswith("`"):
-                clean_params.append("arg" + str(len(clean_params)))
-            elif p in ("true", "false", "null", "undefined", "this"):
-                clean_params.append("arg" + str(len(clean_params)))
-            elif p.lstrip("-").replace(".", "", 1).isdigit():
-                clean_params.append("arg" + str(len(clean_params)))
-            # Remove property access chains: plotCoord.x -> x
-            # Remove function calls: foo() -> skip
-            # Remove array access: arr[i] -> skip
-            # Remove object literals: { x: 1 } -> skip
-            elif "{" in p or "[" in p or "(" in p:
-                clean_params.append("arg" + str(len(clean_params)))
-            elif "." in p:
-                # Use the last part: plotCoord.x -> x
-                parts = p.split(".")
-                clean_params.append(parts[-1])
-            # Skip ALL_CAPS constants (they're not param names)
-            elif p.isupper() or (p.replace("_", "").isupper() and "_" in p):
-                clean_params.append("arg" + str(len(clean_params)))
-            # Skip ternary/conditional expressions
-            elif "?" in p or "!" in p or "=" in p or ">" in p or "<" in p:
-                clean_params.append("arg" + str(len(clean_params)))
-            else:
-                clean_params.append(p)
-
+    if start != -1:
+        clean_params.append(
+            sys.intern(_classify_param(
+                args_str, start, end, first_colon, colon_space,
+                last_dot, has_bracket, has_operator, len(clean_params),
+            ))
+        )
     return clean_params
 
 
@@ -334,187 +490,342 @@ def _clean_return_type(raw_type: str | None) -> str | None:
     # Skip overly complex types
     if len(t) > 60:
         return None
-    return t if t else None
-
-
-def _merge_params(existing: list[str], new: list[str]) -> list[str]:
-    """Merge parameter lists, preferring more descriptive names."""
-    if not existing:
-        return new
-    if not new:
-        return existing
-    # If they have different lengths, prefer the longer one
-    if len(new) > len(existing):
-        return new
-    if len(existing) > len(new):
-        return existing
-    # Same length - prefer names that are more descriptive (longer, not 'arg0')
-    merged = []
-    for e, n in zip(existing, new):
-        if e.startswith("arg") and not n.startswith("arg"):
-            merged.append(n)
-        elif len(n) > len(e) and not n.startswith("arg"):
-            merged.append(n)
-        else:
-            merged.append(e)
-    return merged
+    # Intern: the same handful of types ("number", "boolean", ...) come
+    # back thousands of times across the corpus
+    return sys.intern(t) if t else None
 
 
-def extract_members(
-    sources: list[str],
-) -> tuple[dict[str, dict], dict[str, dict]]:
-    """Extract global and sub-object members from TypeScript sources.
+def _collapse_params(all_params: list[list[str]]) -> list[str]:
+    """Pick the best parameter list from every observed call/signature.
 
-    Returns:
-        (globals_dict, sub_objects_dict) where each dict maps name to
-        {"methods": {...}, "properties": {...}}
+    Observed lists accumulate during the scan and are collapsed once per
+    method here, instead of pairwise-merging on every duplicate match.
+    Longest list wins (most complete signature), ties broken by how many
+    names are real identifiers rather than argN placeholders, then by
+    total name length (descriptive beats terse).
     """
-    globals_data: dict[str, dict] = {}
-    sub_objects_data: dict[str, dict] = {}
-
-    # Initialize structures
-    for g in KNOWN_GLOBALS:
-        globals_data[g] = {"methods": {}, "properties": {}}
-    for s in KNOWN_SUB_OBJECTS:
-        sub_objects_data[s] = {"methods": {}, "properties": {}}
-
-    # Pre-compile patterns
-    global_typed_call_patterns = {g: _build_global_typed_call_pattern(g) for g in KNOWN_GLOBALS}
-    global_call_patterns = {g: _build_global_call_pattern(g) for g in KNOWN_GLOBALS}
-    global_prop_patterns = {g: _build_global_property_pattern(g) for g in KNOWN_GLOBALS}
-    sub_typed_call_patterns = {s: _build_sub_object_typed_call_pattern(s) for s in KNOWN_SUB_OBJECTS}
-    sub_call_patterns = {s: _build_sub_object_call_pattern(s) for s in KNOWN_SUB_OBJECTS}
-    sub_prop_patterns = {s: _build_sub_object_property_pattern(s) for s in KNOWN_SUB_OBJECTS}
-
-    for source in sources:
-        # --- Extract global methods (typed calls first for return types) ---
-        for g_name, pattern in global_typed_call_patterns.items():
-            for match in pattern.finditer(source):
-                return_type = _clean_return_type(match.group(1))
-                method_name = match.group(2)
-                args_str = match.group(3)
-
-                if method_name.startswith("_"):
-                    continue
+    best: list[str] = []
+    best_score = (-1, -1, -1)
+    for params in all_params:
+        score = (
+            len(params),
+            sum(1 for p in params if not p.startswith("arg")),
+            sum(len(p) for p in params),
+        )
+        if score > best_score:
+            best_score = score
+            best = params
+    return best
+
+
+def _new_member_data() -> tuple[dict[str, dict], dict[str, dict]]:
+    """Fresh, fully-initialized globals/sub-objects result dicts."""
+    globals_data: dict[str, dict] = {
+        g: {"methods": {}, "properties": {}} for g in KNOWN_GLOBALS
+    }
+    sub_objects_data: dict[str, dict] = {
+        s: {"methods": {}, "properties": {}} for s in KNOWN_SUB_OBJECTS
+    }
+    return globals_data, sub_objects_data
 
-                params = _extract_param_names(args_str)
-                methods = globals_data[g_name]["methods"]
-
-                if method_name not in methods:
-                    methods[method_name] = {
-                        "params": params,
-                        "return_type": return_type,
-                    }
-                else:
-                    existing = methods[method_name]
-                    existing["params"] = _merge_params(existing["params"], params)
-                    if not existing["return_type"] and return_type:
-                        existing["return_type"] = return_type
-
-        # --- Extract global methods (untyped calls for method/param discovery) ---
-        for g_name, pattern in global_call_patterns.items():
-            for match in pattern.finditer(source):
-                method_name = match.group(1)
-                args_str = match.group(2)
-
-                if method_name.startswith("_"):
-                    continue
 
-                params = _extract_param_names(args_str)
-                methods = globals_data[g_name]["methods"]
-
-                if method_name not in methods:
-                    methods[method_name] = {
-                        "params": params,
-                        "return_type": None,
-                    }
-                else:
-                    existing = methods[method_name]
-                    existing["params"] = _merge_params(existing["params"], params)
-
-        # --- Extract global properties ---
-        for g_name, pattern in global_prop_patterns.items():
-            for match in pattern.finditer(source):
-                prop_type = _clean_return_type(match.group(1))
-                prop_name = match.group(2)
-
-                # Skip internal/private names
-                if prop_name.startswith("_"):
-                    continue
-                # Skip if this is actually a known method (already captured with parens)
-                if prop_name in globals_data[g_name]["methods"]:
-                    continue
-                # Skip if this is a known sub-object name
-                if prop_name in KNOWN_SUB_OBJECTS:
-                    continue
+# Cheap probes for the prefilter below: a global can only match as
+# "Name." and a sub-object only as ".Name.", so a substring miss means
+# the corresponding regex passes cannot match either.
+_GLOBAL_PROBES = tuple(g + "." for g in KNOWN_GLOBALS)
+_SUB_PROBES = tuple("." + s + "." for s in KNOWN_SUB_OBJECTS)
 
-                props = globals_data[g_name]["properties"]
-                if prop_name not in props:
-                    props[prop_name] = {"type": prop_type}
-                elif not props[prop_name]["type"] and prop_type:
-                    props[prop_name]["type"] = prop_type
+# With pyahocorasick installed all ~60 probes are swept in one linear
+# pass, and the regexes then run only on short windows around the hits
+# instead of the whole (often multi-megabyte) source.
+if ahocorasick is not None:
+    _AUTOMATON = ahocorasick.Automaton()
+    for _probe in _GLOBAL_PROBES + _SUB_PROBES:
+        _AUTOMATON.add_word(_probe, _probe)
+    _AUTOMATON.make_automaton()
+else:
+    _AUTOMATON = None
 
-        # --- Extract sub-object methods (typed calls first) ---
-        for s_name, pattern in sub_typed_call_patterns.items():
-            for match in pattern.finditer(source):
-                return_type = _clean_return_type(match.group(1))
-                method_name = match.group(2)
-                args_str = match.group(3)
 
-                if method_name.startswith("_"):
-                    continue
+def _hit_windows(source: str) -> list[tuple[int, int]]:
+    """Return merged windows of *source* around automaton probe hits.
 
-                params = _extract_param_names(args_str)
-                methods = sub_objects_data[s_name]["methods"]
-
-                if method_name not in methods:
-                    methods[method_name] = {
-                        "params": params,
-                        "return_type": return_type,
-                    }
-                else:
-                    existing = methods[method_name]
-                    existing["params"] = _merge_params(existing["params"], params)
-                    if not existing["return_type"] and return_type:
-                        existing["return_type"] = return_type
-
-        # --- Extract sub-object methods (untyped calls) ---
-        for s_name, pattern in sub_call_patterns.items():
-            for match in pattern.finditer(source):
-                method_name = match.group(1)
-                args_str = match.group(2)
-
-                if method_name.startswith("_"):
-                    continue
+    Windows are snapped outward to line boundaries so look-around
+    assertions and the ``[;\n]`` statement terminators see the same
+    immediate context they would on the full text.
+    """
+    spans = [
+        (max(0, end - 140), min(len(source), end + 400))
+        for end, _probe in _AUTOMATON.iter(source)
+    ]
+    if not spans:
+        return spans
+    spans.sort()
+    merged = [spans[0]]
+    for start, stop in spans[1:]:
+        if start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], stop))
+        else:
+            merged.append((start, stop))
+    snapped = []
+    for start, stop in merged:
+        start = source.rfind("\n", 0, start) + 1
+        newline = source.find("\n", stop)
+        snapped.append((start, len(source) if newline == -1 else newline + 1))
+    return snapped
+
+
+def _extract_from_source(
+    source: str,
+    globals_data: dict[str, dict],
+    sub_objects_data: dict[str, dict],
+) -> None:
+    """Run the extraction passes over one source, merging into the dicts.
+
+    A plain substring test per name is far cheaper than a regex pass
+    that finds nothing, and most sources mention only a handful of the
+    tracked names -- so bail out of each half early when nothing can hit.
+    With pyahocorasick available the probes are found in a single sweep
+    and the regexes run on merged windows around the hits only.
+    """
+    if _AUTOMATON is not None:
+        for start, stop in _hit_windows(source):
+            window = source[start:stop]
+            _extract_globals_from_source(window, globals_data)
+            _extract_subs_from_source(window, sub_objects_data)
+        return
+    if any(probe in source for probe in _GLOBAL_PROBES):
+        _extract_globals_from_source(source, globals_data)
+    if any(probe in source for probe in _SUB_PROBES):
+        _extract_subs_from_source(source, sub_objects_data)
+
+
+def _extract_globals_from_source(source: str, globals_data: dict[str, dict]) -> None:
+    """Run the three global-object passes over one source."""
+    # --- Extract global methods (typed calls first for return types) ---
+    # findall hands back ready-made group tuples from C, skipping the
+    # per-match .group() dispatches (same for the five loops below)
+    for raw_type, g_name, method_name, args_str in GLOBAL_TYPED_CALL.findall(source):
+        return_type = _clean_return_type(raw_type)
+        method_name = sys.intern(method_name)
+
+        if method_name.startswith("_"):
+            continue
+
+        params = _extract_param_names(args_str)
+        entry = globals_data[g_name]
+        methods = entry["methods"]
+
+        if method_name not in methods:
+            # A name seen with parens is a method; drop any property
+            # recorded for it from an earlier, paren-less sighting
+            entry["properties"].pop(method_name, None)
+            methods[method_name] = {
+                "all_params": [params],
+                "return_type": return_type,
+            }
+        else:
+            existing = methods[method_name]
+            existing["all_params"].append(params)
+            if not existing["return_type"] and return_type:
+                existing["return_type"] = return_type
+
+    # --- Extract global methods (untyped calls for method/param discovery) ---
+    for g_name, method_name, args_str in GLOBAL_CALL.findall(source):
+        method_name = sys.intern(method_name)
+
+        if method_name.startswith("_"):
+            continue
+
+        params = _extract_param_names(args_str)
+        entry = globals_data[g_name]
+        methods = entry["methods"]
+
+        if method_name not in methods:
+            # A name seen with parens is a method; drop any property
+            # recorded for it from an earlier, paren-less sighting
+            entry["properties"].pop(method_name, None)
+            methods[method_name] = {
+                "all_params": [params],
+                "return_type": None,
+            }
+        else:
+            existing = methods[method_name]
+            existing["all_params"].append(params)
+
+    # --- Extract global properties ---
+    for raw_type, g_name, prop_name in GLOBAL_PROP.findall(source):
+        prop_type = _clean_return_type(raw_type)
+        prop_name = sys.intern(prop_name)
+
+        # Skip internal/private names
+        if prop_name.startswith("_"):
+            continue
+        # Skip if this is actually a known method (already captured with parens)
+        if prop_name in globals_data[g_name]["methods"]:
+            continue
+        # Skip if this is a known sub-object name
+        if prop_name in KNOWN_SUB_OBJECTS:
+            continue
+
+        props = globals_data[g_name]["properties"]
+        if prop_name not in props:
+            props[prop_name] = {"type": prop_type}
+        elif not props[prop_name]["type"] and prop_type:
+            props[prop_name]["type"] = prop_type
+
+
+def _extract_subs_from_source(source: str, sub_objects_data: dict[str, dict]) -> None:
+    """Run the three sub-object passes over one source."""
+    # --- Extract sub-object methods (typed calls first) ---
+    for raw_type, s_name, method_name, args_str in SUB_TYPED_CALL.findall(source):
+        return_type = _clean_return_type(raw_type)
+        method_name = sys.intern(method_name)
+
+        if method_name.startswith("_"):
+            continue
+
+        params = _extract_param_names(args_str)
+        entry = sub_objects_data[s_name]
+        methods = entry["methods"]
+
+        if method_name not in methods:
+            entry["properties"].pop(method_name, None)
+            methods[method_name] = {
+                "all_params": [params],
+                "return_type": return_type,
+            }
+        else:
+            existing = methods[method_name]
+            existing["all_params"].append(params)
+            if not existing["return_type"] and return_type:
+                existing["return_type"] = return_type
+
+    # --- Extract sub-object methods (untyped calls) ---
+    for s_name, method_name, args_str in SUB_CALL.findall(source):
+        method_name = sys.intern(method_name)
+
+        if method_name.startswith("_"):
+            continue
+
+        params = _extract_param_names(args_str)
+        entry = sub_objects_data[s_name]
+        methods = entry["methods"]
+
+        if method_name not in methods:
+            entry["properties"].pop(method_name, None)
+            methods[method_name] = {
+                "all_params": [params],
+                "return_type": None,
+            }
+        else:
+            existing = methods[method_name]
+            existing["all_params"].append(params)
+
+    # --- Extract sub-object properties ---
+    for raw_type, s_name, prop_name in SUB_PROP.findall(source):
+        prop_type = _clean_return_type(raw_type)
+        prop_name = sys.intern(prop_name)
+
+        if prop_name.startswith("_"):
+            continue
+        if prop_name in sub_objects_data[s_name]["methods"]:
+            continue
+
+        props = sub_objects_data[s_name]["properties"]
+        if prop_name not in props:
+            props[prop_name] = {"type": prop_type}
+        elif not props[prop_name]["type"] and prop_type:
+            props[prop_name]["type"] = prop_type
+
+
+def _extract_one(source: str) -> tuple[dict[str, dict], dict[str, dict]]:
+    """Worker entry point: extract a single source into fresh partial dicts."""
+    globals_data, sub_objects_data = _new_member_data()
+    _extract_from_source(source, globals_data, sub_objects_data)
+    return globals_data, sub_objects_data
+
+
+def _merge_member_data(dst: dict[str, dict], partial: dict[str, dict]) -> None:
+    """Merge a partial extraction result into *dst* (same shape)."""
+    for name, p_data in partial.items():
+        d_methods = dst[name]["methods"]
+        d_props = dst[name]["properties"]
+        for method_name, info in p_data["methods"].items():
+            existing = d_methods.get(method_name)
+            if existing is None:
+                d_props.pop(method_name, None)
+                d_methods[method_name] = info
+            else:
+                existing["all_params"].extend(info["all_params"])
+                if not existing["return_type"] and info["return_type"]:
+                    existing["return_type"] = info["return_type"]
+        for prop_name, info in p_data["properties"].items():
+            if prop_name in d_methods:
+                continue
+            existing = d_props.get(prop_name)
+            if existing is None:
+                d_props[prop_name] = info
+            elif not existing["type"] and info["type"]:
+                existing["type"] = info["type"]
 
-                params = _extract_param_names(args_str)
-                methods = sub_objects_data[s_name]["methods"]
-
-                if method_name not in methods:
-                    methods[method_name] = {
-                        "params": params,
-                        "return_type": None,
-                    }
-                else:
-                    existing = methods[method_name]
-                    existing["params"] = _merge_params(existing["params"], params)
-
-        # --- Extract sub-object properties ---
-        for s_name, pattern in sub_prop_patterns.items():
-            for match in pattern.finditer(source):
-                prop_type = _clean_return_type(match.group(1))
-                prop_name = match.group(2)
-
-                if prop_name.startswith("_"):
-                    continue
-                if prop_name in sub_objects_data[s_name]["methods"]:
-                    continue
 
-                props = sub_objects_data[s_name]["properties"]
-                if prop_name not in props:
-                    props[prop_name] = {"type": prop_type}
-                elif not props[prop_name]["type"] and prop_type:
-                    props[prop_name]["type"] = prop_type
+def extract_members(
+    sources,
+    jobs: int | None = None,
+) -> tuple[dict[str, dict], dict[str, dict]]:
+    """Extract global and sub-object members from TypeScript sources.
+
+    *sources* may be any iterable, including a generator; it is
+    consumed exactly once. Each source is independent, so with
+    ``jobs != 1`` the regex-heavy per-source work is sharded across a
+    process pool and only the cheap dict merge runs in the parent;
+    pass ``jobs=1`` to force the sequential path. Submission is capped
+    at a small in-flight window so a streaming producer is not drained
+    into memory ahead of the workers. Patterns are compiled at module
+    import, so POSIX fork workers inherit them and spawn workers
+    rebuild them on import.
+
+    Returns:
+        (globals_dict, sub_objects_dict) where each dict maps name to
+        {"methods": {...}, "properties": {...}}
+    """
+    globals_data, sub_objects_data = _new_member_data()
+
+    if jobs == 1:
+        for source in sources:
+            _extract_from_source(source, globals_data, sub_objects_data)
+    else:
+        from collections import deque
+        from concurrent.futures import ProcessPoolExecutor
+
+        max_inflight = 2 * (jobs or os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            pending: deque = deque()
+            for source in sources:
+                pending.append(executor.submit(_extract_one, source))
+                if len(pending) >= max_inflight:
+                    g_partial, s_partial = pending.popleft().result()
+                    _merge_member_data(globals_data, g_partial)
+                    _merge_member_data(sub_objects_data, s_partial)
+            while pending:
+                g_partial, s_partial = pending.popleft().result()
+                _merge_member_data(globals_data, g_partial)
+                _merge_member_data(sub_objects_data, s_partial)
+
+    return _finalize_member_data(globals_data, sub_objects_data)
+
+
+def _finalize_member_data(
+    globals_data: dict[str, dict],
+    sub_objects_data: dict[str, dict],
+) -> tuple[dict[str, dict], dict[str, dict]]:
+    """Apply the final cleanup passes to merged member data."""
+    # Collapse accumulated param-list observations into one list per method
+    for data in (globals_data, sub_objects_data):
+        for entry in data.values():
+            for info in entry["methods"].values():
+                info["params"] = _collapse_params(info.pop("all_params"))
 
     # Clean up: remove empty entries
     globals_data = {
@@ -526,18 +837,139 @@ def extract_members(
         if v["methods"] or v["properties"]
     }
 
-    # Clean up: remove properties that duplicate method names
-    # (can happen due to regex overlap)
-    for g_data in globals_data.values():
-        for method_name in list(g_data["methods"]):
-            g_data["properties"].pop(method_name, None)
-    for s_data in sub_objects_data.values():
-        for method_name in list(s_data["methods"]):
-            s_data["properties"].pop(method_name, None)
+    return globals_data, sub_objects_data
+
+
+# ---------------------------------------------------------------------------
+# Incremental extraction cache
+#
+# Game patches touch a fraction of the map files, so each file's extracted
+# partial is cached keyed by (mtime_ns, size) and only changed files are
+# reparsed on the next run. Entries for files not seen in the current run
+# are dropped on save, which keeps the cache bounded to the live corpus.
+# ---------------------------------------------------------------------------
 
+_EXTRACT_CACHE_PATH = Path(
+    os.path.expanduser("~/.cache/civ7_terminal/extract_cache.pkl")
+)
+# Bump when extraction semantics change, so stale partials are discarded
+_EXTRACT_CACHE_VERSION = 2
+
+
+def _load_extract_cache() -> dict:
+    """Load the per-map-file partial cache (best-effort)."""
+    try:
+        with open(_EXTRACT_CACHE_PATH, "rb") as f:
+            cached = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+        return {}
+    if (
+        not isinstance(cached, dict)
+        or cached.get("version") != _EXTRACT_CACHE_VERSION
+    ):
+        return {}
+    return cached.get("entries", {})
+
+
+def _save_extract_cache(entries: dict) -> None:
+    """Write the per-map-file partial cache (best-effort)."""
+    try:
+        _EXTRACT_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with open(_EXTRACT_CACHE_PATH, "wb") as f:
+            pickle.dump(
+                {"version": _EXTRACT_CACHE_VERSION, "entries": entries},
+                f,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+    except OSError:
+        pass
+
+
+def _extract_map_partial(map_file: str) -> tuple[dict[str, dict], dict[str, dict]]:
+    """Extract one map file's contribution to the member data."""
+    globals_data, sub_objects_data = _new_member_data()
+    contents = _load_map_contents(map_file)
+    if contents is not None:
+        for source in _usable_sources(contents):
+            _extract_from_source(source, globals_data, sub_objects_data)
     return globals_data, sub_objects_data
 
 
+def extract_members_from_maps(
+    map_files,
+    jobs: int | None = None,
+) -> tuple[dict[str, dict], dict[str, dict], int]:
+    """Extract member data from map files, reusing cached partials.
+
+    Files whose (mtime_ns, size) stamp matches the cache are merged from
+    their stored partials; only changed or new files are reparsed, with
+    the same process-pool sharding as :func:`extract_members`. Partials
+    are merged in *map_files* order either way, so results do not depend
+    on the cache state.
+
+    Returns:
+        (globals_dict, sub_objects_dict, reparsed_count)
+    """
+    entries = _load_extract_cache()
+    fresh: dict[str, tuple] = {}
+    ordered: list[str] = []
+    to_parse: list[str] = []
+    for map_file in map_files:
+        path_str = os.fspath(map_file)
+        try:
+            st = os.stat(path_str)
+        except OSError:
+            continue
+        stamp = (st.st_mtime_ns, st.st_size)
+        ordered.append(path_str)
+        entry = entries.get(path_str)
+        if entry is not None and entry[0] == stamp:
+            fresh[path_str] = entry
+        else:
+            fresh[path_str] = (stamp, None, None)
+            to_parse.append(path_str)
+
+    if to_parse:
+        if jobs == 1 or len(to_parse) == 1:
+            for path_str in to_parse:
+                stamp = fresh[path_str][0]
+                g_partial, s_partial = _extract_map_partial(path_str)
+                fresh[path_str] = (stamp, g_partial, s_partial)
+        else:
+            from collections import deque
+            from concurrent.futures import ProcessPoolExecutor
+
+            max_inflight = 2 * (jobs or os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                pending: deque = deque()
+
+                def harvest() -> None:
+                    path_str, future = pending.popleft()
+                    g_partial, s_partial = future.result()
+                    fresh[path_str] = (fresh[path_str][0], g_partial, s_partial)
+
+                for path_str in to_parse:
+                    pending.append(
+                        (path_str, executor.submit(_extract_map_partial, path_str))
+                    )
+                    if len(pending) >= max_inflight:
+                        harvest()
+                while pending:
+                    harvest()
+
+    _save_extract_cache(fresh)
+
+    globals_data, sub_objects_data = _new_member_data()
+    for path_str in ordered:
+        _stamp, g_partial, s_partial = fresh[path_str]
+        _merge_member_data(globals_data, g_partial)
+        _merge_member_data(sub_objects_data, s_partial)
+    globals_data, sub_objects_data = _finalize_member_data(
+        globals_data, sub_objects_data
+    )
+    return globals_data, sub_objects_data, len(to_parse)
+
+
 def build_completions(
     globals_data: dict[str, dict],
     sub_objects_data: dict[str, dict],
@@ -584,10 +1016,12 @@ def print_stats(completions: dict) -> None:
 
 def parse_args() -> argparse.Namespace:
     """Parse command-line arguments."""
+    # Defaults are spelled out in the help strings rather than via
+    # ArgumentDefaultsHelpFormatter, whose instantiation drags in extra
+    # transitive imports (_colorize/shutil on newer Pythons).
     parser = argparse.ArgumentParser(
         prog="civ7-extract-types",
         description="Extract TypeScript type data from Civ7 source maps for autocomplete",
-        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
     )
     parser.add_argument(
         "--game-dir", "-g",
@@ -599,7 +1033,7 @@ def parse_args() -> argparse.Namespace:
         "--output", "-o",
         type=str,
         default="completions.json",
-        help="Output file path for the completions JSON",
+        help="Output file path for the completions JSON (default: completions.json)",
     )
     return parser.parse_args()
 
@@ -616,8 +1050,8 @@ def main() -> None:
             sys.exit(1)
     else:
         print("Auto-detecting Civ7 game directory...")
-        game_dir = find_game_dir()
-        if not game_dir:
+        detected = find_game_dir()
+        if not detected:
             print(
                 "Error: Could not auto-detect Civ7 game directory.\n"
                 "Use --game-dir to specify the path manually.\n\n"
@@ -628,35 +1062,40 @@ def main() -> None:
                 file=sys.stderr,
             )
             sys.exit(1)
+        game_dir = detected
 
     print(f"Game directory: {game_dir}")
 
     # --- Find source maps ---
     print("Scanning for .js.map files...")
     start_time = time.time()
-    map_files = find_source_maps(game_dir)
+    map_files = list(find_source_maps(game_dir))
     print(f"  Found {len(map_files)} source map files")
 
     if not map_files:
         print("Error: No .js.map files found in the game directory.", file=sys.stderr)
         sys.exit(1)
 
-    # --- Extract TypeScript sources ---
-    print("Extracting TypeScript sources...")
-    sources = extract_typescript_sources(map_files)
-    total_size = sum(len(s) for s in sources)
-    print(f"  Extracted {len(sources)} TypeScript sources ({total_size / 1024 / 1024:.1f} MB)")
-
-    # --- Parse members ---
-    print("Parsing type signatures...")
-    globals_data, sub_objects_data = extract_members(sources)
+    # --- Extract and parse, reusing cached partials for unchanged maps ---
+    print("Extracting and parsing TypeScript sources...")
+    globals_data, sub_objects_data, reparsed = extract_members_from_maps(map_files)
+    print(
+        f"  Parsed {reparsed} changed map files "
+        f"({len(map_files) - reparsed} unchanged, from cache)"
+    )
 
     # --- Build and write output ---
     completions = build_completions(globals_data, sub_objects_data)
 
     output_path = Path(args.output)
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(completions, f, indent=2, sort_keys=False)
+    if orjson is not None:
+        # orjson serializes (and indents) natively, skipping the
+        # stdlib's per-token Python indenter
+        with open(output_path, "wb") as f:
+            f.write(orjson.dumps(completions, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_path, "w", encoding="utf-8") as f:
+            json.dump(completions, f, indent=2, sort_keys=False)
 
     elapsed = time.time() - start_time
     print(f"\nWrote {output_path} ({output_path.stat().st_size / 1024:.1f} KB)")
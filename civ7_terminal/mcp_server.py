@@ -6,6 +6,7 @@ from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Optional
 
 from mcp.server.fastmcp import FastMCP, Context
 from mcp.server.session import ServerSession
@@ -19,15 +20,25 @@ class Civ7Context:
     connection: ConnectionManager
 
 
+# The live connection, bound for the server's lifetime. The server runs
+# one connection per process, so the hot tool paths read this directly
+# instead of walking ctx.request_context.lifespan_context on every call.
+_connection: Optional[ConnectionManager] = None
+
+
 @asynccontextmanager
 async def civ7_lifespan(server: FastMCP) -> AsyncIterator[Civ7Context]:
     """Manage Civ7 connection lifecycle."""
+    global _connection
+
     config = ConnectionConfig(host=_host, port=_port)
     connection = ConnectionManager(config)
     await connection.start()
+    _connection = connection
     try:
         yield Civ7Context(connection=connection)
     finally:
+        _connection = None
         await connection.stop()
 
 
@@ -35,8 +46,39 @@ async def civ7_lifespan(server: FastMCP) -> AsyncIterator[Civ7Context]:
 _host = "127.0.0.1"
 _port = 4318
 
+
+def _build_status_msgs() -> None:
+    """(Re)build the per-state status strings for the current host/port.
+
+    The status resource may be polled; formatting the message once per
+    host/port change instead of per request keeps the endpoint a dict
+    lookup.
+    """
+    global _STATUS_NOT_RUNNING, _STATUS_MSGS
+    _STATUS_NOT_RUNNING = (
+        f"Disconnected from Civ7 ({_host}:{_port}). Server is not running."
+    )
+    _STATUS_MSGS = {
+        ConnectionState.CONNECTED: f"Connected to Civ7 at {_host}:{_port}",
+        ConnectionState.CONNECTING: f"Connecting to Civ7 at {_host}:{_port}...",
+        ConnectionState.DISCONNECTED: (
+            f"Disconnected from Civ7 ({_host}:{_port}). Waiting to reconnect..."
+        ),
+    }
+
+
+_build_status_msgs()
+
 mcp = FastMCP("Civ7 Debug Console", lifespan=civ7_lifespan)
 
+# Static reply strings, built once instead of per call
+_ERROR_NOT_RUNNING = "ERROR: Server is not running."
+_ERROR_NOT_CONNECTED = (
+    "ERROR: Not connected to Civ7 debug port. "
+    "Is the game running with FireTuner enabled?"
+)
+_ERROR_TIMED_OUT = "ERROR: Command timed out or connection lost."
+
 
 @mcp.tool()
 async def execute_js(
@@ -54,15 +96,17 @@ async def execute_js(
         - "GameplayMap.getGridWidth()" returns the map width
         - "Players.getAliveMajorIds()" returns alive player IDs
     """
-    connection = ctx.request_context.lifespan_context.connection
+    connection = _connection
+    if connection is None:
+        return _ERROR_NOT_RUNNING
 
     if connection.state == ConnectionState.DISCONNECTED:
-        return "ERROR: Not connected to Civ7 debug port. Is the game running with FireTuner enabled?"
+        return _ERROR_NOT_CONNECTED
 
     response = await connection.send_command(code)
 
     if response is None:
-        return "ERROR: Command timed out or connection lost."
+        return _ERROR_TIMED_OUT
 
     return response
 
@@ -70,37 +114,30 @@ async def execute_js(
 @mcp.resource("civ7://status")
 async def get_status(ctx: Context[ServerSession, Civ7Context]) -> str:
     """Get current connection status to the Civ7 debug port."""
-    connection = ctx.request_context.lifespan_context.connection
-    state = connection.state
+    if _connection is None:
+        return _STATUS_NOT_RUNNING
+    return _STATUS_MSGS[_connection.state]
 
-    if state == ConnectionState.CONNECTED:
-        return f"Connected to Civ7 at {_host}:{_port}"
-    elif state == ConnectionState.CONNECTING:
-        return f"Connecting to Civ7 at {_host}:{_port}..."
-    else:
-        return f"Disconnected from Civ7 ({_host}:{_port}). Waiting to reconnect..."
 
-
-# Locate API_LIBRARY.md relative to the project root
+# Locate API_LIBRARY.md relative to the project root and read it once:
+# the file is static for the server's lifetime, so per-request fetches
+# serve from memory with no stat or read syscalls
 _api_library_path = Path(__file__).resolve().parent.parent / "API_LIBRARY.md"
+try:
+    _api_library_text: Optional[str] = _api_library_path.read_text(encoding="utf-8")
+except OSError:
+    _api_library_text = None
 
 
 @mcp.resource("civ7://api-library")
 async def get_api_library() -> str:
     """Full Civ7 JavaScript API reference — all known methods, properties, and patterns."""
-    if _api_library_path.is_file():
-        return _api_library_path.read_text(encoding="utf-8")
+    if _api_library_text is not None:
+        return _api_library_text
     return "ERROR: API_LIBRARY.md not found. Expected at: " + str(_api_library_path)
 
 
-@mcp.tool()
-async def help() -> str:
-    """Show available Civ7 API categories and how to use the debug console.
-
-    Returns a quick-reference summary of all known API areas. For full details
-    on every method, read the civ7://api-library resource.
-    """
-    return """=== Civ7 Debug Console — Quick Reference ===
+_HELP_TEXT = """=== Civ7 Debug Console — Quick Reference ===
 
 TOOLS:
   execute_js(code)  — Run JavaScript on the Civ7 debug port. Last expression is returned.
@@ -149,6 +186,16 @@ TIPS:
 """
 
 
+@mcp.tool()
+async def help() -> str:
+    """Show available Civ7 API categories and how to use the debug console.
+
+    Returns a quick-reference summary of all known API areas. For full details
+    on every method, read the civ7://api-library resource.
+    """
+    return _HELP_TEXT
+
+
 def main():
     """Entry point for the MCP server."""
     global _host, _port
@@ -163,6 +210,7 @@ def main():
 
     _host = args.host
     _port = args.port
+    _build_status_msgs()
 
     if args.transport == "streamable-http":
         mcp.run(transport="streamable-http", host="0.0.0.0", port=args.http_port)
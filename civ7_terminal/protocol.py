@@ -10,6 +10,11 @@ MESSAGE_TYPE = 3
 CMD_PREFIX = "CMD:65535:"
 HEADER_SIZE = 8  # 4 bytes length + 4 bytes type
 
+# Pre-compiled header layout; struct.pack/unpack with a literal format
+# string re-parses the format on every call
+_HEADER_STRUCT = struct.Struct("<II")
+_CMD_PREFIX_BYTES = CMD_PREFIX.encode("ascii")
+
 
 class ProtocolError(Exception):
     """Raised when protocol encoding/decoding fails."""
@@ -42,25 +47,28 @@ def encode_command(javascript: str) -> bytes:
         ProtocolError: If encoding fails.
     """
     try:
-        # Build payload with null terminator
-        payload = f"{CMD_PREFIX}{javascript}\0"
-        payload_bytes = payload.encode("utf-8")
-
-        # Build header: length (4 bytes LE) + type (4 bytes LE)
-        length = len(payload_bytes)
-        header = struct.pack("<II", length, MESSAGE_TYPE)
-
-        return header + payload_bytes
+        # Write header and payload into one preallocated buffer instead
+        # of building an f-string, encoding it, and concatenating
+        js_bytes = javascript.encode("utf-8")
+        prefix_len = len(_CMD_PREFIX_BYTES)
+        length = prefix_len + len(js_bytes) + 1  # +1 for null terminator
+        buf = bytearray(HEADER_SIZE + length)
+        _HEADER_STRUCT.pack_into(buf, 0, length, MESSAGE_TYPE)
+        buf[HEADER_SIZE:HEADER_SIZE + prefix_len] = _CMD_PREFIX_BYTES
+        buf[HEADER_SIZE + prefix_len:HEADER_SIZE + prefix_len + len(js_bytes)] = js_bytes
+        # Trailing byte is already zero: the null terminator
+        return bytes(buf)
     except Exception as e:
         raise ProtocolError(f"Failed to encode command: {e}") from e
 
 
-def decode_header(data: bytes) -> tuple[int, int]:
+def decode_header(data: bytes | bytearray) -> tuple[int, int]:
     """
     Decode the 8-byte header from received data.
 
     Args:
-        data: The 8-byte header data.
+        data: The 8-byte header data (any buffer; the receive loop
+            passes its accumulation bytearray directly).
 
     Returns:
         Tuple of (payload_length, message_type).
@@ -72,7 +80,8 @@ def decode_header(data: bytes) -> tuple[int, int]:
         raise ProtocolError(f"Header too short: expected {HEADER_SIZE} bytes, got {len(data)}")
 
     try:
-        length, msg_type = struct.unpack("<II", data[:HEADER_SIZE])
+        # unpack_from reads in place, skipping the data[:HEADER_SIZE] slice
+        length, msg_type = _HEADER_STRUCT.unpack_from(data, 0)
         return length, msg_type
     except struct.error as e:
         raise ProtocolError(f"Failed to decode header: {e}") from e
@@ -92,10 +101,13 @@ def decode_payload(data: bytes) -> str:
         ProtocolError: If decoding fails.
     """
     try:
-        # Strip null terminator if present
-        if data and data[-1:] == b'\0':
-            data = data[:-1]
-        return data.decode("utf-8")
+        # Strip null terminator if present. Slicing a memoryview doesn't
+        # copy, and str() decodes straight from it, so the payload isn't
+        # duplicated just to drop one byte.
+        view = memoryview(data)
+        if view.nbytes and view[-1] == 0:
+            view = view[:-1]
+        return str(view, "utf-8")
     except UnicodeDecodeError as e:
         raise ProtocolError(f"Failed to decode payload: {e}") from e
 
@@ -114,10 +126,25 @@ def decode_message(header: bytes, payload: bytes) -> Message:
     Raises:
         ProtocolError: If decoding fails.
     """
-    length, msg_type = decode_header(header)
+    # Runs once per received frame, so the header unpack, length check,
+    # null-strip and decode are fused here rather than delegated to
+    # decode_header/decode_payload (kept for callers that frame
+    # incrementally)
+    if len(header) < HEADER_SIZE:
+        raise ProtocolError(f"Header too short: expected {HEADER_SIZE} bytes, got {len(header)}")
+
+    try:
+        length, msg_type = _HEADER_STRUCT.unpack_from(header, 0)
+    except struct.error as e:
+        raise ProtocolError(f"Failed to decode header: {e}") from e
 
     if len(payload) != length:
         raise ProtocolError(f"Payload length mismatch: expected {length}, got {len(payload)}")
 
-    payload_str = decode_payload(payload)
-    return Message(msg_type=msg_type, payload=payload_str)
+    try:
+        view = memoryview(payload)
+        if length and view[length - 1] == 0:
+            view = view[:length - 1]
+        return Message(msg_type=msg_type, payload=str(view, "utf-8"))
+    except UnicodeDecodeError as e:
+        raise ProtocolError(f"Failed to decode payload: {e}") from e
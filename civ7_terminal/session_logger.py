@@ -1,6 +1,8 @@
 """Session logger for recording terminal sessions."""
 
+import asyncio
 import os
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, TextIO
@@ -16,9 +18,31 @@ class SessionLogger:
     Logs terminal sessions to timestamped files.
 
     Creates log files in the format: session_YYYY-MM-DD_HH-MM-SS.log
-    Writes incrementally and flushes after each entry.
+    Writes go through Python's buffered file object; the buffer is
+    flushed at most every half second (and on errors and stop), so a
+    verbose session doesn't pay a syscall per line. When started inside
+    a running event loop, lines are queued and written in batches by a
+    background task, so callers on the UI path never wait on the disk;
+    without a loop the logger falls back to direct writes.
     """
 
+    # Seconds between forced flushes of the write buffer
+    _FLUSH_INTERVAL = 0.5
+
+    # Timestamp formatting cache: entries logged within the same second
+    # share one strftime call (class-wide, like the format itself)
+    _ts_second = -1
+    _ts_cached = ""
+
+    @classmethod
+    def _timestamp(cls) -> str:
+        """Current HH:MM:SS, reformatted at most once per second."""
+        now = int(time.time())
+        if now != cls._ts_second:
+            cls._ts_cached = time.strftime("%H:%M:%S", time.localtime(now))
+            cls._ts_second = now
+        return cls._ts_cached
+
     def __init__(self, session_dir: str = "./sessions"):
         """
         Initialize the session logger.
@@ -29,6 +53,9 @@ class SessionLogger:
         self._session_dir = Path(session_dir)
         self._file: Optional[TextIO] = None
         self._filepath: Optional[Path] = None
+        self._last_flush = 0.0
+        self._queue: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
 
     @property
     def filepath(self) -> Optional[Path]:
@@ -62,6 +89,16 @@ class SessionLogger:
             # Open file for writing
             self._file = open(self._filepath, "w", encoding="utf-8")
 
+            # Decouple callers from disk latency when a loop is running
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                self._queue = None
+                self._writer_task = None
+            else:
+                self._queue = asyncio.Queue()
+                self._writer_task = loop.create_task(self._drain())
+
             # Write session header
             self._write_line(f"Session started: {datetime.now().isoformat()}")
             self._write_line("-" * 50)
@@ -78,6 +115,20 @@ class SessionLogger:
         Writes a session end marker and flushes all data.
         """
         if self._file is not None:
+            if self._writer_task is not None:
+                self._writer_task.cancel()
+                self._writer_task = None
+            if self._queue is not None:
+                # Write whatever the background task hadn't drained yet
+                queue, self._queue = self._queue, None
+                pending = []
+                while True:
+                    try:
+                        pending.append(queue.get_nowait())
+                    except asyncio.QueueEmpty:
+                        break
+                if pending:
+                    self._write_batch(pending)
             try:
                 self._write_line("-" * 50)
                 self._write_line(f"Session ended: {datetime.now().isoformat()}")
@@ -97,14 +148,14 @@ class SessionLogger:
         if self._file is None:
             return
 
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        # Handle multiline commands
-        lines = command.split("\n")
-        for i, line in enumerate(lines):
-            if i == 0:
-                self._write_line(f"[{timestamp}] > {line}")
-            else:
-                self._write_line(f"[{timestamp}]   {line}")
+        timestamp = self._timestamp()
+        # Handle multiline commands as one block: a single timestamp
+        # format and a single write for the whole entry
+        first, *rest = command.split("\n")
+        block = f"[{timestamp}] > {first}"
+        for line in rest:
+            block += f"\n[{timestamp}]   {line}"
+        self._write_line(block)
 
     def log_response(self, response: str) -> None:
         """
@@ -116,11 +167,11 @@ class SessionLogger:
         if self._file is None:
             return
 
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        # Handle multiline responses
-        lines = response.split("\n")
-        for line in lines:
-            self._write_line(f"[{timestamp}] {line}")
+        timestamp = self._timestamp()
+        # Handle multiline responses as one block (see log_command)
+        self._write_line(
+            "\n".join(f"[{timestamp}] {line}" for line in response.split("\n"))
+        )
 
     def log_error(self, error: str) -> None:
         """
@@ -132,8 +183,9 @@ class SessionLogger:
         if self._file is None:
             return
 
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self._write_line(f"[{timestamp}] ERROR: {error}")
+        timestamp = self._timestamp()
+        # Errors flush immediately so they survive a crash
+        self._write_line(f"[{timestamp}] ERROR: {error}", force_flush=True)
 
     def log_info(self, info: str) -> None:
         """
@@ -145,15 +197,43 @@ class SessionLogger:
         if self._file is None:
             return
 
-        timestamp = datetime.now().strftime("%H:%M:%S")
+        timestamp = self._timestamp()
         self._write_line(f"[{timestamp}] INFO: {info}")
 
-    def _write_line(self, line: str) -> None:
-        """Write a line to the log file and flush."""
+    def _write_line(self, line: str, force_flush: bool = False) -> None:
+        """Queue a line for the writer task, or write it directly."""
+        if self._queue is not None:
+            self._queue.put_nowait((line, force_flush))
+        else:
+            self._write_batch([(line, force_flush)])
+
+    async def _drain(self) -> None:
+        """Write queued lines in batches until cancelled."""
+        queue = self._queue
+        if queue is None:
+            return
+        while True:
+            items = [await queue.get()]
+            # Batch whatever else has accumulated into one write
+            while True:
+                try:
+                    items.append(queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            self._write_batch(items)
+
+    def _write_batch(self, items: list) -> None:
+        """Write (line, force_flush) pairs, flushing at most periodically."""
         if self._file is not None:
             try:
-                self._file.write(line + "\n")
-                self._file.flush()
+                self._file.write("".join(line + "\n" for line, _ in items))
+                now = time.monotonic()
+                if (
+                    any(force for _, force in items)
+                    or now - self._last_flush >= self._FLUSH_INTERVAL
+                ):
+                    self._file.flush()
+                    self._last_flush = now
             except Exception:
                 pass  # Don't crash on log write failure
 
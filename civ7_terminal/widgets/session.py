@@ -100,6 +100,10 @@ class TerminalSession(Widget):
         """Add an info message."""
         self.terminal.add_info(info)
 
+    def add_info_block(self, lines) -> None:
+        """Add several info lines as one write."""
+        self.terminal.add_info_block(lines)
+
     def add_error(self, error: str, replace_last: bool = False) -> None:
         """Add an error message."""
         self.terminal.add_error(error, replace_last=replace_last)
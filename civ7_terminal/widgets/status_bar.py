@@ -1,5 +1,7 @@
 """Status bar widget showing connection state."""
 
+from typing import Optional
+
 from textual.app import ComposeResult
 from textual.reactive import reactive
 from textual.widget import Widget
@@ -61,6 +63,11 @@ class StatusBar(Widget):
     }
     """
 
+    # Cached children; the watchers re-run on every state/countdown tick
+    # and query_one walks the tree each time
+    _status_widget: Optional[Static] = None
+    _host_widget: Optional[Static] = None
+
     state: reactive[ConnectionState] = reactive(ConnectionState.DISCONNECTED)
     retry_countdown: reactive[float | None] = reactive(None)
     host: reactive[str] = reactive("127.0.0.1")
@@ -96,7 +103,9 @@ class StatusBar(Widget):
 
     def _update_status(self) -> None:
         """Update the status indicator."""
-        status_widget = self.query_one("#status", Static)
+        status_widget = self._status_widget
+        if status_widget is None:
+            status_widget = self._status_widget = self.query_one("#status", Static)
 
         if self.state == ConnectionState.CONNECTED:
             status_widget.update("[●]")
@@ -113,7 +122,9 @@ class StatusBar(Widget):
 
     def _update_host_info(self) -> None:
         """Update the host info display."""
-        host_widget = self.query_one("#host-info", Static)
+        host_widget = self._host_widget
+        if host_widget is None:
+            host_widget = self._host_widget = self.query_one("#host-info", Static)
         host_widget.update(f"{self.host}:{self.port}")
 
     def set_connection_state(
@@ -128,8 +139,12 @@ class StatusBar(Widget):
             state: The new connection state.
             retry_countdown: Seconds until retry (for disconnected state).
         """
-        self.state = state
-        self.retry_countdown = retry_countdown
+        # Sync both reactives without firing their watchers, then
+        # refresh once: plain assignment would run _update_status twice
+        # per retry tick
+        self.set_reactive(StatusBar.state, state)
+        self.set_reactive(StatusBar.retry_countdown, retry_countdown)
+        self._update_status()
 
     def set_host_info(self, host: str, port: int) -> None:
         """
@@ -139,5 +154,8 @@ class StatusBar(Widget):
             host: The host address.
             port: The port number.
         """
-        self.host = host
-        self.port = port
+        # Same coalescing as set_connection_state: one refresh for the
+        # pair of fields
+        self.set_reactive(StatusBar.host, host)
+        self.set_reactive(StatusBar.port, port)
+        self._update_host_info()
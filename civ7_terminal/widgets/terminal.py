@@ -1,7 +1,14 @@
 """Terminal output widget for displaying command history and responses."""
 
 import json
-from typing import Optional
+from array import array
+from functools import lru_cache
+from typing import Iterable, Optional
+
+try:
+    import orjson  # optional, much faster pretty-printing of big responses
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
 from rich.segment import Segment
 from rich.style import Style
@@ -16,51 +23,96 @@ STYLE_RESPONSE = Style(color="green")         # Green
 STYLE_ERROR = Style(color="red", bold=True)   # Red
 STYLE_INFO = Style(color="yellow")            # Yellow
 
+# Shared encoder for the stdlib fallback: json.dumps builds a fresh
+# JSONEncoder per call. ensure_ascii=False keeps unicode verbatim
+# (matching orjson's output) and skips the per-character escape scan
+_JSON_ENCODER = json.JSONEncoder(
+    indent=2, ensure_ascii=False, check_circular=False
+)
+
+# Line-class codes, indexing into _STYLES; stored per document line so
+# render_line never has to rescan prefixes
+_CLASS_RESPONSE = 0
+_CLASS_COMMAND = 1
+_CLASS_ERROR = 2
+_CLASS_INFO = 3
+_STYLES = (STYLE_RESPONSE, STYLE_COMMAND, STYLE_ERROR, STYLE_INFO)
+
+
+@lru_cache(maxsize=256)
+def _pretty_json(response: str) -> str:
+    """Pretty-print a JSON response, memoized on the raw string.
+
+    Repeated identical responses (status polls, heartbeats) are common
+    in a terminal session; the cache turns the re-parse into a dict hit.
+    Entries are bounded by the 64 KiB gate in _format_response.
+    """
+    try:
+        if orjson is not None:
+            return orjson.dumps(
+                orjson.loads(response), option=orjson.OPT_INDENT_2
+            ).decode()
+        return _JSON_ENCODER.encode(json.loads(response))
+    except ValueError:
+        return response
+
+
+def _classify_line(line: str) -> int:
+    """Map a line to its class code by prefix.
+
+    The first-character gate lets the common response line fall through
+    on cheap equality checks instead of three startswith calls.
+    """
+    c0 = line[:1]
+    if c0 == ">" and line.startswith("> "):
+        return _CLASS_COMMAND
+    if c0 == "E" and line.startswith("ERROR:"):
+        return _CLASS_ERROR
+    if c0 == "I" and line.startswith("INFO:"):
+        return _CLASS_INFO
+    return _CLASS_RESPONSE
+
 
 class HighlightedTextArea(TextArea):
     """TextArea with prefix-based color highlighting."""
 
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        # Class code per document line, maintained by TerminalOutput as
+        # lines are appended/trimmed, so scrolling never rescans text
+        self._line_classes: array = array("B")
+
     def render_line(self, y: int) -> Strip:
         """Render a line with color based on prefix."""
+        # y is visual row - add scroll offset to get document line.
+        # Rows past the end of the document render blank; skip the
+        # superclass render entirely for them
+        doc_line = y + self.scroll_offset.y
+        if doc_line >= self.document.line_count:
+            return Strip.blank(self.size.width)
+
         strip = super().render_line(y)
 
-        # y is visual row - add scroll offset to get document line
-        doc_line = y + self.scroll_offset.y
-        if doc_line < self.document.line_count:
-            line = self.document.get_line(doc_line)
-
-            # Determine color based on line prefix
-            if line.startswith("> "):
-                color_style = STYLE_COMMAND
-            elif line.startswith("ERROR:"):
-                color_style = STYLE_ERROR
-            elif line.startswith("INFO:"):
-                color_style = STYLE_INFO
-            else:
-                color_style = STYLE_RESPONSE
-
-            # Rebuild strip with our color
-            new_segments = []
-            for seg in strip:
-                if seg.control:
-                    new_segments.append(seg)
-                    continue
-
-                # Apply our color, preserve selection bgcolor
-                if seg.style and seg.style.bgcolor:
-                    new_style = Style(
-                        color=color_style.color,
-                        bgcolor=seg.style.bgcolor,
-                        bold=color_style.bold,
-                    )
-                else:
-                    new_style = color_style
-
-                new_segments.append(Segment(seg.text, new_style, seg.control))
-
-            return Strip(new_segments)
-
-        return strip
+        classes = self._line_classes
+        if doc_line < len(classes):
+            color_style = _STYLES[classes[doc_line]]
+        else:
+            # Line landed outside the tracked append path; fall back
+            # to scanning its prefix
+            color_style = _STYLES[
+                _classify_line(self.document.get_line(doc_line))
+            ]
+
+        # Recolor in one pass: rich applies a post-style as
+        # segment_style + ours, so our color/bold win while each
+        # segment's own bgcolor (the selection) survives, and control
+        # segments pass through untouched. (Strip's own apply_style
+        # layers the style underneath, which would let the theme color
+        # win.)
+        return Strip(
+            Segment.apply_style(strip, post_style=color_style),
+            strip.cell_length,
+        )
 
 
 class TerminalOutput(Widget):
@@ -92,14 +144,34 @@ class TerminalOutput(Widget):
     }
     """
 
+    # Scrollback cap: once the buffer passes MAX_LINES, the oldest
+    # TRIM_LINES are dropped in a single delete, keeping memory and
+    # per-append cost bounded over a long session
+    MAX_LINES = 5000
+    TRIM_LINES = 500
+
+    # Cached child lookup -- query_one walks the widget tree on every
+    # call, and the output methods run for each line of a busy session
+    _text_area: Optional[HighlightedTextArea] = None
+
+    # True while a deferred scroll is queued; lets a burst of appends
+    # collapse into one cursor move per refresh
+    _scroll_pending = False
+
     def compose(self) -> ComposeResult:
         """Compose the terminal output layout."""
         yield HighlightedTextArea(id="output-scroll", read_only=True)
 
     def on_mount(self) -> None:
         """Configure the text area on mount."""
-        text_area = self.query_one(TextArea)
-        text_area.show_line_numbers = False
+        self._get_text_area().show_line_numbers = False
+
+    def _get_text_area(self) -> HighlightedTextArea:
+        """Return the output TextArea, querying it only once."""
+        text_area = self._text_area
+        if text_area is None:
+            text_area = self._text_area = self.query_one(HighlightedTextArea)
+        return text_area
 
     def add_command(self, command: str) -> None:
         """
@@ -108,14 +180,9 @@ class TerminalOutput(Widget):
         Args:
             command: The command string entered by the user.
         """
-        # Handle multiline commands - first line gets "> " prefix
-        lines = command.split("\n")
-        for i, line in enumerate(lines):
-            if i == 0:
-                self._append_line(f"> {line}")
-            else:
-                self._append_line(f"> {line}")
-
+        # Every line keeps the "> " prefix (the highlighter colors by it);
+        # join them so a multiline command is one insert, not one per line
+        self._append_line("\n".join("> " + line for line in command.split("\n")))
         self._scroll_to_bottom()
 
     def add_response(self, response: str) -> None:
@@ -155,28 +222,64 @@ class TerminalOutput(Widget):
         self._append_line(f"INFO: {info}")
         self._scroll_to_bottom()
 
+    def add_info_block(self, lines: Iterable[str]) -> None:
+        """
+        Add several info lines as a single append.
+
+        One write and one scroll instead of one per line -- used for
+        multi-line output like the /help text.
+
+        Args:
+            lines: The info lines (each gets its own INFO: prefix).
+        """
+        self._append_line("\n".join("INFO: " + line for line in lines))
+        self._scroll_to_bottom()
+
     def clear(self) -> None:
         """Clear all output."""
-        text_area = self.query_one(TextArea)
+        text_area = self._get_text_area()
+        del text_area._line_classes[:]
         text_area.load_text("")
 
     def _append_line(self, text: str) -> None:
-        """Append a line to the output."""
-        text_area = self.query_one(TextArea)
-        current = text_area.text
-        if current:
-            text_area.load_text(current + "\n" + text)
-        else:
-            text_area.load_text(text)
+        """Append a line to the output.
+
+        Inserts at the document end rather than rebuilding the whole
+        buffer with load_text, which costs the full session length per
+        appended line.
+        """
+        text_area = self._get_text_area()
+        classes = text_area._line_classes
+        classes.extend(map(_classify_line, text.split("\n")))
+
+        end = text_area.document.end
+        if end != (0, 0):
+            text = "\n" + text
+        text_area.insert(text, location=end, maintain_selection_offset=False)
+
+        # Enforce the scrollback cap with one ranged delete of the
+        # oldest lines (line_count is already tracked by the document)
+        line_count = text_area.document.line_count
+        if line_count > self.MAX_LINES:
+            trim = line_count - self.MAX_LINES + self.TRIM_LINES
+            text_area.delete(
+                (0, 0), (trim, 0), maintain_selection_offset=False
+            )
+            del classes[:trim]
 
     def _replace_last_line(self, text: str) -> None:
         """Replace the last line of the output."""
-        text_area = self.query_one(TextArea)
+        text_area = self._get_text_area()
         current = text_area.text
         if "\n" in current:
             current = current.rsplit("\n", 1)[0] + "\n" + text
         else:
             current = text
+        # load_text rewrites the whole buffer, so rebuild the class
+        # codes to match (same O(N) cost as the rewrite itself)
+        text_area._line_classes[:] = array(
+            "B", map(_classify_line, current.split("\n"))
+        )
         text_area.load_text(current)
 
     def _format_response(self, response: str) -> str:
@@ -185,21 +288,47 @@ class TerminalOutput(Widget):
 
         Attempts to pretty-print JSON.
         """
-        stripped = response.strip()
-
-        # Try to parse as JSON and pretty-print
-        if stripped.startswith(("{", "[")):
-            try:
-                parsed = json.loads(stripped)
-                return json.dumps(parsed, indent=2)
-            except json.JSONDecodeError:
-                pass
+        # Don't pretty-print huge responses: parsing and re-serializing
+        # them stalls the UI thread for longer than the formatting is
+        # worth, and the indented copy roughly doubles the memory held
+        if len(response) > 65536:
+            return response
+
+        # Peek at the first non-whitespace character without the full
+        # copy that .strip() makes of a large response
+        head = response[:64].lstrip()
+        if not head and len(response) > 64:
+            head = response.lstrip()
+
+        # Only attempt a parse when the last non-whitespace character
+        # closes the opening bracket -- prose that merely starts with a
+        # brace would otherwise pay a full parse just to throw
+        first = head[:1]
+        if first == "{" or first == "[":
+            tail = response[-64:].rstrip()
+            if not tail and len(response) > 64:
+                tail = response.rstrip()
+            last = tail[-1:]
+            if last == ("}" if first == "{" else "]"):
+                return _pretty_json(response)
 
         return response
 
     def _scroll_to_bottom(self) -> None:
-        """Scroll to the bottom of the output."""
-        text_area = self.query_one(TextArea)
+        """Request a scroll to the bottom of the output.
+
+        Deferred with call_after_refresh so a burst of appended lines
+        (a streamed response, the /help block) moves the cursor once
+        instead of once per line.
+        """
+        if not self._scroll_pending:
+            self._scroll_pending = True
+            self.call_after_refresh(self._do_scroll)
+
+    def _do_scroll(self) -> None:
+        """Perform the deferred cursor move."""
+        self._scroll_pending = False
+        text_area = self._get_text_area()
         line_count = text_area.document.line_count
         if line_count > 0:
             text_area.cursor_location = (line_count - 1, 0)
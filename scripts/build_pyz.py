@@ -0,0 +1,86 @@
+"""Build a single-file civ7-terminal.pyz zipapp.
+
+Stages the package into a temporary directory, pre-compiles bytecode so the
+interpreter never re-parses source at startup, and writes one compressed
+archive with civ7_terminal.__main__:main as the entry point. Running from a
+single zip replaces the per-module stat/open traffic of a source tree with
+cached bytecode reads from one file.
+
+Usage:
+    python scripts/build_pyz.py [--output civ7-terminal.pyz]
+"""
+
+import argparse
+import compileall
+import shutil
+import sys
+import tempfile
+import zipapp
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        prog="build_pyz",
+        description="Build a standalone civ7-terminal.pyz zipapp",
+    )
+    parser.add_argument(
+        "--output", "-o",
+        type=str,
+        default="civ7-terminal.pyz",
+        help="Output archive path (default: civ7-terminal.pyz)",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    """Build the zipapp archive."""
+    args = parse_args()
+
+    package_dir = PROJECT_ROOT / "civ7_terminal"
+    if not package_dir.is_dir():
+        print(f"Error: Package directory not found: {package_dir}", file=sys.stderr)
+        sys.exit(1)
+
+    with tempfile.TemporaryDirectory() as staging_str:
+        staging = Path(staging_str)
+
+        print("Staging package...")
+        shutil.copytree(
+            package_dir,
+            staging / "civ7_terminal",
+            ignore=shutil.ignore_patterns("__pycache__"),
+        )
+
+        # Bundle the completions data inside the package, where the app
+        # can reach it through importlib.resources when running from the
+        # archive (a path relative to __file__ would point into the zip)
+        completions = PROJECT_ROOT / "completions.json"
+        if completions.is_file():
+            shutil.copy2(completions, staging / "civ7_terminal" / "completions.json")
+
+        # Pre-compile with legacy (in-place .pyc) layout -- zipimport only
+        # uses bytecode stored next to the source, not __pycache__ dirs.
+        print("Pre-compiling bytecode...")
+        if not compileall.compile_dir(staging, quiet=1, legacy=True):
+            print("Error: Bytecode compilation failed", file=sys.stderr)
+            sys.exit(1)
+
+        output = Path(args.output)
+        print("Writing archive...")
+        zipapp.create_archive(
+            staging,
+            target=output,
+            interpreter="/usr/bin/env python3",
+            main="civ7_terminal.__main__:main",
+            compressed=True,
+        )
+
+    print(f"Wrote {output} ({output.stat().st_size / 1024:.1f} KB)")
+
+
+if __name__ == "__main__":
+    main()
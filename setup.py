@@ -0,0 +1,38 @@
+"""Optional mypyc build hook.
+
+By default this is a no-op and the package installs pure Python. Set
+CIV7_MYPYC=1 to AOT-compile the CLI module with mypyc, turning
+parse_args/ensure_session_dir/main into C-speed dispatch:
+
+    CIV7_MYPYC=1 pip install .
+
+(__main__.py itself stays pure Python -- ``python -m civ7_terminal``
+needs a module with a code object, so it is a thin shim over cli.py.)
+
+Also compiles extract_types, whose per-character argument scanner and
+per-match merge loops are pure interpreter work between regex calls --
+the part of the extraction pipeline mypyc actually speeds up.
+
+Requires mypy[mypyc] in the build environment when enabled. The
+optional accelerators (orjson, msgspec, re2, pyahocorasick) ship no
+stubs, hence --ignore-missing-imports; their try/except fallbacks then
+type as Any and stay valid.
+"""
+
+import os
+
+from setuptools import setup
+
+ext_modules = []
+if os.environ.get("CIV7_MYPYC"):
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify(
+        [
+            "--ignore-missing-imports",
+            "civ7_terminal/cli.py",
+            "civ7_terminal/extract_types.py",
+        ]
+    )
+
+setup(ext_modules=ext_modules)